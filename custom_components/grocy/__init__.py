@@ -7,12 +7,14 @@ https://github.com/iamkarlson/grocy
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from aiohttp import ClientConnectorError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 
 from .config_flow import async_migrate_entry
 from .const import (
@@ -35,12 +37,31 @@ from .const import (
 )
 from .coordinator import GrocyDataUpdateCoordinator
 from .grocy_data import GrocyData, async_setup_endpoint_for_image_proxy
+from .helpers import calendar_store
 from .services import async_setup_services, async_unload_services
 
 __all__ = ["async_migrate_entry"]
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Entities provided by each Grocy feature flag
+FEATURE_ENTITIES: dict[str, tuple[str, ...]] = {
+    "FEATURE_FLAG_STOCK": (
+        ATTR_STOCK,
+        ATTR_MISSING_PRODUCTS,
+        ATTR_EXPIRED_PRODUCTS,
+        ATTR_EXPIRING_PRODUCTS,
+        ATTR_OVERDUE_PRODUCTS,
+    ),
+    "FEATURE_FLAG_SHOPPINGLIST": (ATTR_SHOPPING_LIST,),
+    "FEATURE_FLAG_TASKS": (ATTR_TASKS, ATTR_OVERDUE_TASKS),
+    "FEATURE_FLAG_CHORES": (ATTR_CHORES, ATTR_OVERDUE_CHORES),
+    "FEATURE_FLAG_RECIPES": (ATTR_MEAL_PLAN,),
+    "FEATURE_FLAG_BATTERIES": (ATTR_BATTERIES, ATTR_OVERDUE_BATTERIES),
+}
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Set up this integration using UI."""
@@ -51,10 +72,11 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     )
 
     try:
-        coordinator.available_entities = await _async_get_available_entities(
-            coordinator.grocy_data
+        # Both hit the Grocy server independently, so run them concurrently
+        available_entities, _ = await asyncio.gather(
+            _async_get_available_entities(coordinator.grocy_data),
+            coordinator.async_config_entry_first_refresh(),
         )
-        await coordinator.async_config_entry_first_refresh()
     except (
         ConnectionRefusedError,
         ClientConnectorError,
@@ -64,12 +86,16 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         _LOGGER.warning("Unable to connect to Grocy: %s", error)
         raise ConfigEntryNotReady(f"Unable to connect to Grocy: {error}") from error
 
-    hass.data.setdefault(DOMAIN, {})
+    coordinator.available_entities = available_entities
+
     hass.data[DOMAIN] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
-    await async_setup_services(hass, config_entry)
-    await async_setup_endpoint_for_image_proxy(hass, config_entry.data)
+    # Platforms, services and the image proxy do not depend on each other
+    await asyncio.gather(
+        hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS),
+        async_setup_services(hass, config_entry),
+        async_setup_endpoint_for_image_proxy(hass, config_entry.data),
+    )
 
     return True
 
@@ -85,35 +111,23 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the calendar cache of a deleted config entry."""
+    await calendar_store(hass, config_entry.entry_id).async_remove()
+
+
 async def _async_get_available_entities(grocy_data: GrocyData) -> list[str]:
     """Return a list of available entities based on enabled Grocy features."""
-    available_entities = []
+    available_entities: list[str] = []
     grocy_config = await grocy_data.async_get_config()
     if grocy_config:
-        if "FEATURE_FLAG_STOCK" in grocy_config.enabled_features:
-            available_entities.append(ATTR_STOCK)
-            available_entities.append(ATTR_MISSING_PRODUCTS)
-            available_entities.append(ATTR_EXPIRED_PRODUCTS)
-            available_entities.append(ATTR_EXPIRING_PRODUCTS)
-            available_entities.append(ATTR_OVERDUE_PRODUCTS)
-
-        if "FEATURE_FLAG_SHOPPINGLIST" in grocy_config.enabled_features:
-            available_entities.append(ATTR_SHOPPING_LIST)
-
-        if "FEATURE_FLAG_TASKS" in grocy_config.enabled_features:
-            available_entities.append(ATTR_TASKS)
-            available_entities.append(ATTR_OVERDUE_TASKS)
-
-        if "FEATURE_FLAG_CHORES" in grocy_config.enabled_features:
-            available_entities.append(ATTR_CHORES)
-            available_entities.append(ATTR_OVERDUE_CHORES)
-
-        if "FEATURE_FLAG_RECIPES" in grocy_config.enabled_features:
-            available_entities.append(ATTR_MEAL_PLAN)
-
-        if "FEATURE_FLAG_BATTERIES" in grocy_config.enabled_features:
-            available_entities.append(ATTR_BATTERIES)
-            available_entities.append(ATTR_OVERDUE_BATTERIES)
+        enabled_features = set(grocy_config.enabled_features)
+        available_entities = [
+            entity
+            for feature, entities in FEATURE_ENTITIES.items()
+            if feature in enabled_features
+            for entity in entities
+        ]
 
     _LOGGER.debug("Available entities: %s", available_entities)
 
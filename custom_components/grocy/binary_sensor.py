@@ -152,7 +152,9 @@ class GrocyBinarySensorEntity(GrocyEntity, BinarySensorEntity):
         """Return the extra state attributes."""
         attrs = super().extra_state_attributes
         if self.entity_description.key == ATTR_EXPIRING_PRODUCTS:
-            if attrs is None:
-                attrs = {}
-            attrs["due_soon_days"] = self.coordinator.grocy_data.due_soon_days
+            # Copy the attributes, the base entity caches them between refreshes
+            attrs = {
+                **(attrs or {}),
+                "due_soon_days": self.coordinator.grocy_data.due_soon_days,
+            }
         return attrs
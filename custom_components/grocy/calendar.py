@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import functools
+import hashlib
+import itertools
 import logging
-from collections.abc import Callable
-from datetime import UTC, date, datetime, timedelta
+import operator
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime, timedelta, tzinfo
+from typing import Any
 
-import icalendar
+from aiohttp import ClientSession, hdrs
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -15,7 +22,9 @@ from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_API_KEY,
@@ -24,16 +33,35 @@ from .const import (
     CONF_PORT,
     CONF_URL,
     CONF_VERIFY_SSL,
+    DATA_CALENDAR_ICAL_URL,
     DEFAULT_CALENDAR_SYNC_INTERVAL,
     DOMAIN,
     NAME,
     VERSION,
 )
 from .coordinator import GrocyDataUpdateCoordinator
-from .helpers import extract_base_url_and_path
+from .helpers import calendar_store, extract_base_url_and_path
+from .ical_parser import RawEvent, dump_raw_events, load_raw_events, read_vevents
 
 _LOGGER = logging.getLogger(__name__)
 HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+HTTP_UNAUTHORIZED = 401
+HTTP_NOT_FOUND = 404
+ICAL_URL_REFRESH_INTERVAL = timedelta(hours=24)
+# Events are cached for this long before and after today
+EVENT_WINDOW = timedelta(days=365)
+# Extra margin cached around the range requested by the calendar view
+EVENT_WINDOW_PADDING = timedelta(days=30)
+STORAGE_SAVE_DELAY = 10
+# Bump when the cached events change meaning, so older caches are dropped
+CACHE_FORMAT = 2
+START_OF_DAY = datetime.min.time()
+END_OF_DAY = datetime.max.time()
+ONE_DAY = timedelta(days=1)
+# Duration of timed events without an end
+DEFAULT_EVENT_DURATION = timedelta(hours=1)
+_EVENT_START = operator.attrgetter("start")
 
 
 async def async_setup_entry(
@@ -61,22 +89,49 @@ class GrocyCalendarEntity(CalendarEntity):
         super().__init__()
         self._coordinator = coordinator
         self._config_entry = config_entry
-        self._ical_url: str | None = None
+        # The entry is reloaded whenever the connection settings change, so the
+        # sharing-link endpoint can be built once
+        self._sharing_link_api_url = _sharing_link_api_url(config_entry.data)
+        # The sharing link rarely changes, so reuse the one persisted on the entry
+        self._ical_url: str | None = config_entry.data.get(DATA_CALENDAR_ICAL_URL)
+        self._ical_url_etag: str | None = None
+        self._ical_url_last_checked: datetime | None = None
+        self._raw_events: list[RawEvent] = []
         self._events: list[CalendarEvent] = []
+        self._events_window: tuple[datetime, datetime] | None = None
+        self._event_starts: list[datetime] = []
+        self._event_max_ends: list[datetime] = []
+        # The current event and the time until which it stays the answer
+        self._event_cache: tuple[datetime | None, CalendarEvent | None] | None = None
         self._sync_interval_minutes: int = config_entry.data.get(
             CONF_CALENDAR_SYNC_INTERVAL, DEFAULT_CALENDAR_SYNC_INTERVAL
         )
         self._fix_timezone: bool = config_entry.data.get(
             CONF_CALENDAR_FIX_TIMEZONE, True
         )
+        self._verify_ssl: bool = config_entry.data.get(CONF_VERIFY_SSL, False)
+        self._session: ClientSession | None = None
+        self._store: Store[dict[str, Any]] | None = None
         self._unsub_update: Callable[[], None] | None = None
         self._last_update: datetime | None = None
+        self._events_valid_until: datetime | None = None
+        self._written_state: tuple[bool | None, list[CalendarEvent]] | None = None
+        self._ical_hash: bytes | None = None
+        self._ical_etag: str | None = None
+        self._ical_last_modified: str | None = None
 
         # Entity attributes
         self._attr_name = "Grocy calendar"
         self._attr_unique_id = f"{config_entry.entry_id}calendar"
         self._attr_available = True
         self._attr_icon = "mdi:calendar"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=NAME,
+            manufacturer=NAME,
+            sw_version=VERSION,
+            entry_type=DeviceEntryType.SERVICE,
+        )
 
         # Add entity_description for coordinator compatibility
         # (even though calendar doesn't use coordinator data)
@@ -85,43 +140,57 @@ class GrocyCalendarEntity(CalendarEntity):
             name="Grocy calendar",
         )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Grocy device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry.entry_id)},
-            name=NAME,
-            manufacturer=NAME,
-            sw_version=VERSION,
-            entry_type=DeviceEntryType.SERVICE,
-        )
-
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
         now = dt_util.now()
-        # Find events that are currently happening or upcoming
+        if self._event_cache is not None:
+            valid_until, cached_event = self._event_cache
+            if valid_until is None or now < valid_until:
+                return cached_event
+
+        # Find the earliest event that is currently happening or upcoming
         # An event is "current" if now is between start and end (inclusive)
         # An event is "upcoming" if start is in the future
         # For all-day events, start is 00:00:00 and end is 23:59:59 of the day
-        current_or_upcoming = [
-            event
-            for event in self._events
-            if event.start <= now <= event.end or event.start > now
-        ]
-
-        if not current_or_upcoming:
-            return None
-        # Return the earliest event (current or upcoming)
-        return min(current_or_upcoming, key=lambda e: e.start)
+        # Events are sorted by start, so everything before first_upcoming has
+        # already started
+        first_upcoming = bisect.bisect_right(self._event_starts, now)
+        # The running max of end times is sorted too, so the first event that
+        # has not ended yet is the earliest current one
+        first_current = bisect.bisect_left(self._event_max_ends, now)
+        if first_current < first_upcoming:
+            event = self._events[first_current]
+        elif first_upcoming < len(self._events):
+            event = self._events[first_upcoming]
+        else:
+            event = None
+
+        # The answer only changes once the next event starts or the earliest
+        # current one ends, so reuse it until then
+        boundaries = []
+        if first_upcoming < len(self._events):
+            boundaries.append(self._event_starts[first_upcoming])
+        if first_current < len(self._events):
+            boundaries.append(self._event_max_ends[first_current])
+        self._event_cache = (min(boundaries) if boundaries else None, event)
+        return event
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        # Fetch iCal URL on startup (don't fail if it errors)
+        # Restore the events cached before the last restart, the first sync
+        # then only has to revalidate them with Grocy
+        self._store = calendar_store(self.hass, self._config_entry.entry_id)
         try:
-            await self._fetch_ical_url()
+            await self._async_load_cached_events()
         except Exception as error:
-            _LOGGER.warning("Error fetching iCal URL during startup: %s", error)
+            _LOGGER.warning("Error loading cached calendar events: %s", error)
+        # Fetch iCal URL on startup (don't fail if it errors)
+        if not self._ical_url:
+            try:
+                await self._fetch_ical_url()
+            except Exception as error:
+                _LOGGER.warning("Error fetching iCal URL during startup: %s", error)
         # Set up periodic updates
         self._schedule_update()
 
@@ -152,24 +221,41 @@ class GrocyCalendarEntity(CalendarEntity):
                 # Still mark as available even if URL fetch fails
                 # The entity can retry later
                 self._attr_available = True
-                self.async_write_ha_state()
+                self._async_write_state_if_changed()
                 return
 
         # Update events for a wide range (e.g., 1 year back, 1 year forward)
-        # Use local timezone
-        now = dt_util.now()
-        start_date = now - timedelta(days=365)
-        end_date = now + timedelta(days=365)
+        start_date, end_date = self._default_events_window()
         try:
-            await self._update_events(start_date, end_date)
-            self._last_update = dt_util.now()
+            if self._ical_url_is_stale():
+                # Revalidate the sharing link while fetching the feed from the
+                # known one, a changed link is picked up on the next sync
+                await asyncio.gather(
+                    self._fetch_ical_url(),
+                    self._update_events(start_date, end_date),
+                )
+            else:
+                await self._update_events(start_date, end_date)
             self._attr_available = True
-            self.async_write_ha_state()
+            self._async_write_state_if_changed()
         except Exception as error:
             _LOGGER.error("Error updating calendar events: %s", error)
             # Keep entity available even on error, so it can retry
             self._attr_available = True
-            self.async_write_ha_state()
+            self._async_write_state_if_changed()
+
+    def _async_write_state_if_changed(self) -> None:
+        """Write the state unless the availability and the events are unchanged."""
+        # The events list is replaced whenever it changes, so identity is enough.
+        # CalendarEntity schedules its own state writes at event boundaries
+        if (
+            self._written_state is not None
+            and self._written_state[0] == self._attr_available
+            and self._written_state[1] is self._events
+        ):
+            return
+        self._written_state = (self._attr_available, self._events)
+        self.async_write_ha_state()
 
     async def async_get_events(
         self,
@@ -185,267 +271,390 @@ class GrocyCalendarEntity(CalendarEntity):
             _LOGGER.warning("Unable to fetch iCal URL from Grocy")
             return []
 
-        # Check if we need to refresh events
-        should_refresh = False
-        if not self._events or self._last_update is None:
+        # Refresh if the feed was never fetched or the last sync is older than
+        # the sync interval, repeated calls in between share the cached events
+        should_refresh = (
+            self._ical_hash is None
+            or self._events_valid_until is None
+            or dt_util.utcnow() >= self._events_valid_until
+        )
+
+        # Expand range to ensure we have enough events cached, but never drop
+        # the default window the next-event state relies on
+        default_start, default_end = self._default_events_window()
+        expanded_start = min(start_date - EVENT_WINDOW_PADDING, default_start)
+        expanded_end = max(end_date + EVENT_WINDOW_PADDING, default_end)
+        if not self._events_window_covers(start_date, end_date):
             should_refresh = True
-        else:
-            # Refresh if last update was more than sync interval ago
-            # Use local timezone
-            now = dt_util.now()
-            if self._last_update.tzinfo is None:
-                # If last_update is naive, assume local timezone
-                local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
-                last_update_local = self._last_update.replace(tzinfo=local_tz)
-            else:
-                last_update_local = dt_util.as_local(self._last_update)
-            time_since_update = now - last_update_local
-            if time_since_update >= timedelta(minutes=self._sync_interval_minutes):
-                should_refresh = True
 
         if should_refresh:
-            # Expand range to ensure we have enough events cached
-            expanded_start = start_date - timedelta(days=30)
-            expanded_end = end_date + timedelta(days=30)
             try:
                 await self._update_events(expanded_start, expanded_end)
             except Exception as error:
                 _LOGGER.error("Error fetching calendar events: %s", error)
 
-        # Filter events to requested time range
-        return [
-            event for event in self._events if start_date <= event.start <= end_date
-        ]
+        # Filter events to requested time range, events are sorted by start
+        first = bisect.bisect_left(self._event_starts, start_date)
+        last = bisect.bisect_right(self._event_starts, end_date)
+        return self._events[first:last]
+
+    def _get_session(self) -> ClientSession:
+        """Return the shared client session used for all requests to Grocy."""
+        # Both the sharing-link and the iCal requests go to the same host, so use
+        # one session to keep the connection alive between them
+        if self._session is None:
+            self._session = async_get_clientsession(
+                self.hass, verify_ssl=self._verify_ssl
+            )
+        return self._session
+
+    def _ical_url_is_stale(self) -> bool:
+        """Return True if the sharing link should be revalidated with Grocy."""
+        return (
+            self._ical_url_last_checked is None
+            or dt_util.utcnow() - self._ical_url_last_checked
+            >= ICAL_URL_REFRESH_INTERVAL
+        )
 
     async def _fetch_ical_url(self) -> None:
         """Fetch the iCal sharing link from Grocy API."""
         try:
-            url = self._config_entry.data[CONF_URL]
-            api_key = self._config_entry.data[CONF_API_KEY]
-            port = self._config_entry.data.get(CONF_PORT, 9192)
-            verify_ssl = self._config_entry.data.get(CONF_VERIFY_SSL, False)
-
-            (base_url, path) = extract_base_url_and_path(url)
-
-            if path:
-                api_url = f"{base_url}:{port}/{path}/api/calendar/ical/sharing-link"
-            else:
-                api_url = f"{base_url}:{port}/api/calendar/ical/sharing-link"
-
             headers = {
-                "GROCY-API-KEY": api_key,
+                "GROCY-API-KEY": self._config_entry.data[CONF_API_KEY],
                 "accept": "application/json",
             }
-
-            session = async_get_clientsession(self.hass, verify_ssl=verify_ssl)
-
-            async with session.get(api_url, headers=headers) as response:
-                if response.status == HTTP_OK:
-                    data = await response.json()
-                    self._ical_url = data.get("url")
+            if self._ical_url and self._ical_url_etag:
+                headers[hdrs.IF_NONE_MATCH] = self._ical_url_etag
+
+            async with self._get_session().get(
+                self._sharing_link_api_url, headers=headers
+            ) as response:
+                if response.status == HTTP_NOT_MODIFIED:
+                    self._ical_url_last_checked = dt_util.utcnow()
+                    _LOGGER.debug("iCal URL not modified: %s", self._ical_url)
+                elif response.status == HTTP_OK:
+                    data = await response.json(loads=json_loads)
+                    self._set_ical_url(data.get("url"))
+                    self._ical_url_etag = response.headers.get(hdrs.ETAG)
+                    self._ical_url_last_checked = dt_util.utcnow()
                     _LOGGER.debug("Fetched iCal URL: %s", self._ical_url)
                 else:
                     _LOGGER.error("Failed to fetch iCal URL: HTTP %s", response.status)
         except Exception as error:
             _LOGGER.error("Error fetching iCal URL: %s", error)
 
-    async def _update_events(  # noqa: PLR0915
-        self, start_date: datetime, end_date: datetime
-    ) -> None:
+    def _set_ical_url(self, url: str | None) -> None:
+        """Set the iCal URL and persist it on the config entry when it changed."""
+        self._ical_url = url
+        if url and url != self._config_entry.data.get(DATA_CALENDAR_ICAL_URL):
+            self.hass.config_entries.async_update_entry(
+                self._config_entry,
+                data={**self._config_entry.data, DATA_CALENDAR_ICAL_URL: url},
+            )
+
+    async def _update_events(self, start_date: datetime, end_date: datetime) -> None:
         """Update events from iCal URL."""
         if not self._ical_url:
             return
 
+        # Conditional GET: let the server answer 304 when the feed is unchanged
+        headers = {}
+        if self._ical_etag:
+            headers[hdrs.IF_NONE_MATCH] = self._ical_etag
+        if self._ical_last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = self._ical_last_modified
+
         try:
-            session = async_get_clientsession(self.hass)
-            async with session.get(self._ical_url) as response:
+            async with self._get_session().get(
+                self._ical_url, headers=headers
+            ) as response:
+                if response.status == HTTP_NOT_MODIFIED:
+                    _LOGGER.debug("iCal data not modified, keeping cached events")
+                    self._mark_updated(dt_util.now())
+                    self._convert_events(start_date, end_date)
+                    return
+
+                if response.status in (HTTP_UNAUTHORIZED, HTTP_NOT_FOUND):
+                    # The sharing link was revoked or regenerated, fetch it again
+                    # on the next sync
+                    _LOGGER.warning(
+                        "iCal URL rejected with HTTP %s, refreshing sharing link",
+                        response.status,
+                    )
+                    self._ical_url_last_checked = None
+                    self._ical_url_etag = None
+                    return
+
                 if response.status != HTTP_OK:
                     _LOGGER.error("Failed to fetch iCal data: HTTP %s", response.status)
                     return
 
-                ical_data = await response.text()
-                # Run icalendar parsing in executor to avoid blocking I/O
-                calendar = await self.hass.async_add_executor_job(
-                    icalendar.Calendar.from_ical, ical_data
+                validators = (
+                    response.headers.get(hdrs.ETAG),
+                    response.headers.get(hdrs.LAST_MODIFIED),
+                )
+                validators_changed = validators != (
+                    self._ical_etag,
+                    self._ical_last_modified,
                 )
 
-                events: list[CalendarEvent] = []
-
-                for component in calendar.walk():
-                    if component.name == "VEVENT":
-                        summary = str(component.get("summary", ""))
-                        start = component.get("dtstart")
-                        end = component.get("dtend")
-                        description = str(component.get("description", ""))
-                        location = str(component.get("location", ""))
-                        uid = str(component.get("uid", ""))
-
-                        _LOGGER.debug(
-                            "Parsing event '%s': fix_timezone=%s",
-                            summary,
-                            self._fix_timezone,
-                        )
+                # icalendar accepts bytes, so skip decoding the body to a str
+                ical_data = await response.read()
+
+                # Skip parsing entirely when the payload is identical to the last one.
+                # This also covers servers that send neither ETag nor Last-Modified
+                digest = hashlib.blake2b(ical_data, digest_size=16).digest()
+                if digest == self._ical_hash:
+                    _LOGGER.debug("iCal data unchanged, keeping cached events")
+                    self._ical_etag, self._ical_last_modified = validators
+                    self._mark_updated(dt_util.now())
+                    self._convert_events(start_date, end_date)
+                    if validators_changed:
+                        # Keep the stored validators in sync so the next
+                        # restart can still revalidate with a 304
+                        self._schedule_save_cached_events()
+                    return
 
-                        if start:
-                            # Check if this is a date-only (all-day) event
-                            is_all_day = not isinstance(start.dt, datetime)
-
-                            # Get local timezone
-                            local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
-
-                            # Handle both date and datetime
-                            if isinstance(start.dt, datetime):
-                                event_start = start.dt
-                                # Ensure timezone-aware
-                                if event_start.tzinfo is None:
-                                    # Naive datetime from iCal - typically UTC in iCal format
-                                    # Convert from UTC to local timezone
-                                    event_start_utc = event_start.replace(tzinfo=UTC)
-                                    event_start = dt_util.as_local(event_start_utc)
-                                else:
-                                    # Has timezone info - convert to local timezone
-                                    # This handles UTC or other timezones from Grocy
-                                    # Grocy addon sends local times marked as UTC, so we fix it
-                                    original_start = event_start
-                                    original_tz = event_start.tzinfo
-                                    is_utc = (
-                                        event_start.tzinfo == UTC
-                                        or str(event_start.tzinfo) == "UTC"
-                                        or (
-                                            hasattr(event_start.tzinfo, "zone")
-                                            and event_start.tzinfo.zone == "UTC"
-                                        )
-                                    )
-                                    if self._fix_timezone and is_utc:
-                                        # Fix for Grocy addon: Grocy is sending local times marked as UTC
-                                        # Treat the UTC time as if it's already in local timezone
-                                        event_start = event_start.replace(
-                                            tzinfo=local_tz
-                                        )
-                                        _LOGGER.debug(
-                                            "Event '%s': Fix timezone enabled - treating UTC as local: %s (tz: %s) -> %s (tz: %s), fix_timezone=%s",
-                                            summary,
-                                            original_start,
-                                            original_tz,
-                                            event_start,
-                                            event_start.tzinfo,
-                                            self._fix_timezone,
-                                        )
-                                    else:
-                                        event_start = dt_util.as_local(event_start)
-                                        _LOGGER.debug(
-                                            "Event '%s': Standard timezone conversion: %s (tz: %s) -> %s (tz: %s), fix_timezone=%s",
-                                            summary,
-                                            original_start,
-                                            original_tz,
-                                            event_start,
-                                            event_start.tzinfo,
-                                            self._fix_timezone,
-                                        )
-                            else:
-                                # Date-only events (all-day) - convert to datetime at start of day in local timezone
-                                event_start = datetime.combine(
-                                    start.dt, datetime.min.time(), tzinfo=local_tz
-                                )
-
-                            # Don't filter here - cache all events, filter when needed
-                            if end:
-                                if isinstance(end.dt, datetime):
-                                    event_end = end.dt
-                                    # Ensure timezone-aware
-                                    if event_end.tzinfo is None:
-                                        # Naive datetime from iCal - typically UTC in iCal format
-                                        # Convert from UTC to local timezone
-                                        event_end_utc = event_end.replace(tzinfo=UTC)
-                                        event_end = dt_util.as_local(event_end_utc)
-                                    else:
-                                        # Has timezone info - convert to local timezone
-                                        # This handles UTC or other timezones from Grocy
-                                        # Grocy addon sends local times marked as UTC, so we fix it
-                                        original_end = event_end
-                                        original_end_tz = event_end.tzinfo
-                                        is_end_utc = (
-                                            event_end.tzinfo == UTC
-                                            or str(event_end.tzinfo) == "UTC"
-                                            or (
-                                                hasattr(event_end.tzinfo, "zone")
-                                                and event_end.tzinfo.zone == "UTC"
-                                            )
-                                        )
-                                        if self._fix_timezone and is_end_utc:
-                                            # Fix for Grocy addon: Grocy is sending local times marked as UTC
-                                            # Treat the UTC time as if it's already in local timezone
-                                            event_end = event_end.replace(
-                                                tzinfo=local_tz
-                                            )
-                                            _LOGGER.debug(
-                                                "Event '%s' (end): Fix timezone enabled - treating UTC as local: %s (tz: %s) -> %s (tz: %s), fix_timezone=%s",
-                                                summary,
-                                                original_end,
-                                                original_end_tz,
-                                                event_end,
-                                                event_end.tzinfo,
-                                                self._fix_timezone,
-                                            )
-                                        else:
-                                            event_end = dt_util.as_local(event_end)
-                                            _LOGGER.debug(
-                                                "Event '%s' (end): Standard timezone conversion: %s (tz: %s) -> %s (tz: %s), fix_timezone=%s",
-                                                summary,
-                                                original_end,
-                                                original_end_tz,
-                                                event_end,
-                                                event_end.tzinfo,
-                                                self._fix_timezone,
-                                            )
-                                else:
-                                    # Date-only end - for all-day events, end date is exclusive
-                                    # In iCal, if an event is on Dec 21, end date is Dec 22
-                                    # So we subtract 1 day and set to end of that day
-                                    end_date = end.dt
-                                    if isinstance(end_date, date):
-                                        # End date is exclusive, so subtract 1 day for the actual end
-                                        # Then set to end of that day (23:59:59.999999) in local timezone
-                                        actual_end_date = end_date - timedelta(days=1)
-                                        event_end = datetime.combine(
-                                            actual_end_date,
-                                            datetime.max.time(),
-                                            tzinfo=local_tz,
-                                        )
-                                    else:
-                                        # Shouldn't happen, but handle it
-                                        event_end = datetime.combine(
-                                            end_date,
-                                            datetime.max.time(),
-                                            tzinfo=local_tz,
-                                        )
-                            elif is_all_day:
-                                # All-day event with no end - ends at end of start day in local timezone
-                                event_end = datetime.combine(
-                                    start.dt,
-                                    datetime.max.time(),
-                                    tzinfo=local_tz,
-                                )
-                            else:
-                                # If no end time, assume 1 hour duration
-                                event_end = event_start + timedelta(hours=1)
-
-                            events.append(
-                                CalendarEvent(
-                                    summary=summary,
-                                    start=event_start,
-                                    end=event_end,
-                                    description=description,
-                                    location=location,
-                                    uid=uid,
-                                )
-                            )
-
-                # Sort events by start time for better performance
-                events.sort(key=lambda e: e.start)
-                self._events = events
-                _LOGGER.debug("Fetched %d calendar events", len(events))
+                # Parse and convert in a single executor job to avoid blocking
+                # the event loop
+                raw_events, events = await self.hass.async_add_executor_job(
+                    self._read_ical_data, ical_data, start_date, end_date
+                )
+                self._raw_events = raw_events
+                self._set_events(events)
+                self._events_window = (start_date, end_date)
+                self._ical_hash = digest
+                # Only remember the validators of a feed that was parsed, so a
+                # failed parse is not answered with a 304 on the next sync
+                self._ical_etag, self._ical_last_modified = validators
+                self._mark_updated(dt_util.now())
+                _LOGGER.debug("Fetched %d calendar events", len(self._events))
+                self._schedule_save_cached_events()
 
         except Exception as error:
             _LOGGER.error("Error parsing iCal data: %s", error)
-            self._events = []
+            self._raw_events = []
+            self._set_events([])
+            self._events_window = None
+            self._ical_hash = None
+            self._ical_etag = None
+            self._ical_last_modified = None
+
+    async def _async_load_cached_events(self) -> None:
+        """Restore the iCal feed cached by a previous run."""
+        if self._store is None or (data := await self._store.async_load()) is None:
+            return
+        if data.get("format") != CACHE_FORMAT:
+            _LOGGER.debug("Ignoring calendar cache written by an older version")
+            return
+
+        # Restoring TZID values may read zoneinfo files, keep it off the loop
+        self._raw_events = await self.hass.async_add_executor_job(
+            load_raw_events, data["events"]
+        )
+        self._ical_hash = bytes.fromhex(data["hash"])
+        self._ical_etag = data.get("etag")
+        self._ical_last_modified = data.get("last_modified")
+        if last_update := dt_util.parse_datetime(data["last_update"]):
+            self._mark_updated(last_update)
+        self._convert_events(*self._default_events_window())
+        _LOGGER.debug("Loaded %d cached calendar events", len(self._raw_events))
+
+    def _schedule_save_cached_events(self) -> None:
+        """Cache the parsed iCal feed so it survives a restart."""
+        if self._store is None or self._ical_hash is None:
+            return
+
+        data = {
+            "format": CACHE_FORMAT,
+            "hash": self._ical_hash.hex(),
+            "etag": self._ical_etag,
+            "last_modified": self._ical_last_modified,
+            "last_update": (self._last_update or dt_util.now()).isoformat(),
+            "events": dump_raw_events(self._raw_events),
+        }
+        # Written off the sync path, and flushed when Home Assistant stops
+        self._store.async_delay_save(lambda: data, STORAGE_SAVE_DELAY)
+
+    def _mark_updated(self, last_update: datetime) -> None:
+        """Record a successful sync and until when its events are fresh."""
+        self._last_update = last_update
+        self._events_valid_until = last_update + timedelta(
+            minutes=self._sync_interval_minutes
+        )
+
+    def _default_events_window(self) -> tuple[datetime, datetime]:
+        """Return the window of events cached by the periodic sync."""
+        # Align to whole days so the window only moves once a day
+        today = dt_util.start_of_local_day()
+        return today - EVENT_WINDOW, today + EVENT_WINDOW + ONE_DAY
+
+    def _events_window_covers(self, start_date: datetime, end_date: datetime) -> bool:
+        """Return True if the cached events include the given range."""
+        return (
+            self._events_window is not None
+            and self._events_window[0] <= start_date
+            and end_date <= self._events_window[1]
+        )
+
+    def _convert_events(self, start_date: datetime, end_date: datetime) -> None:
+        """Convert the cached raw events overlapping the given range."""
+        if self._events_window_covers(start_date, end_date):
+            return
+        self._set_events(
+            self._parse_ical_events(self._raw_events, start_date, end_date)
+        )
+        self._events_window = (start_date, end_date)
+
+    def _read_ical_data(
+        self, ical_data: bytes, start_date: datetime, end_date: datetime
+    ) -> tuple[list[RawEvent], list[CalendarEvent]]:
+        """Parse an iCal payload and convert the events overlapping a range."""
+        raw_events = read_vevents(ical_data)
+        return raw_events, self._parse_ical_events(raw_events, start_date, end_date)
+
+    def _set_events(self, events: list[CalendarEvent]) -> None:
+        """Store events sorted by start and rebuild the lookup indexes."""
+        self._events = events
+        self._event_cache = None
+        self._event_starts = [event.start for event in events]
+        self._event_max_ends = list(
+            itertools.accumulate((event.end for event in events), max)
+        )
+
+    def _parse_ical_events(
+        self,
+        raw_events: list[RawEvent],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Convert raw VEVENTs overlapping a range into events sorted by start."""
+        events: list[CalendarEvent] = []
+        # Resolve the local timezone once per parse, not once per event
+        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        for summary, start, end, description, location, uid in raw_events:
+            if debug:
+                _LOGGER.debug(
+                    "Parsing event '%s': fix_timezone=%s",
+                    summary,
+                    self._fix_timezone,
+                )
+
+            if start:
+                # Check if this is a date-only (all-day) event
+                is_all_day = not isinstance(start, datetime)
+
+                # Handle both date and datetime
+                if not is_all_day:
+                    event_start = self._convert_datetime_to_local(
+                        start, summary, local_tz
+                    )
+                else:
+                    # Date-only events (all-day) - convert to datetime at start of day in local timezone
+                    event_start = datetime.combine(start, START_OF_DAY, tzinfo=local_tz)
+
+                # Don't filter here - cache all events, filter when needed
+                if end:
+                    if isinstance(end, datetime):
+                        event_end = self._convert_datetime_to_local(
+                            end, summary, local_tz, is_end=True
+                        )
+                    else:
+                        # Date-only end - for all-day events, end date is exclusive
+                        # In iCal, if an event is on Dec 21, end date is Dec 22
+                        # So we subtract 1 day and set to end of that day
+                        # (23:59:59.999999) in local timezone
+                        actual_end_date = end - ONE_DAY
+                        event_end = datetime.combine(
+                            actual_end_date,
+                            END_OF_DAY,
+                            tzinfo=local_tz,
+                        )
+                elif is_all_day:
+                    # All-day event with no end - ends at end of start day in local timezone
+                    event_end = datetime.combine(
+                        start,
+                        END_OF_DAY,
+                        tzinfo=local_tz,
+                    )
+                else:
+                    # If no end time, assume 1 hour duration
+                    event_end = event_start + DEFAULT_EVENT_DURATION
+
+                # Skip events outside the cached range before building them
+                if event_end < start_date or event_start > end_date:
+                    continue
+
+                events.append(
+                    CalendarEvent(
+                        summary=summary,
+                        start=event_start,
+                        end=event_end,
+                        description=description,
+                        location=location,
+                        uid=uid,
+                    )
+                )
+
+        # Sort events by start time for better performance
+        events.sort(key=_EVENT_START)
+        return events
+
+    def _convert_datetime_to_local(
+        self,
+        dt: datetime,
+        summary: str,
+        local_tz: tzinfo | None,
+        is_end: bool = False,
+    ) -> datetime:
+        """Convert an event start or end datetime to the local timezone."""
+        if dt.tzinfo is None:
+            # Naive datetime from iCal - typically UTC in iCal format
+            # Convert from UTC to local timezone
+            return dt_util.as_local(dt.replace(tzinfo=UTC))
+
+        if dt.tzinfo is local_tz:
+            # Already local (e.g. a TZID matching the Home Assistant timezone)
+            return dt
+
+        # Has timezone info - convert to local timezone
+        # This handles UTC or other timezones from Grocy
+        # Grocy addon sends local times marked as UTC, so we fix it
+        if self._fix_timezone and _is_utc(dt.tzinfo):
+            # Fix for Grocy addon: Grocy is sending local times marked as UTC
+            # Treat the UTC time as if it's already in local timezone
+            converted = dt.replace(tzinfo=local_tz)
+            debug_message = "Event '%s'%s: Fix timezone enabled - treating UTC as local: %s (tz: %s) -> %s (tz: %s), fix_timezone=%s"
+        else:
+            converted = dt_util.as_local(dt)
+            debug_message = "Event '%s'%s: Standard timezone conversion: %s (tz: %s) -> %s (tz: %s), fix_timezone=%s"
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                debug_message,
+                summary,
+                " (end)" if is_end else "",
+                dt,
+                dt.tzinfo,
+                converted,
+                converted.tzinfo,
+                self._fix_timezone,
+            )
+        return converted
+
+
+def _sharing_link_api_url(data: Mapping[str, Any]) -> str:
+    """Return the Grocy API endpoint returning the iCal sharing link."""
+    (base_url, path) = extract_base_url_and_path(data.get(CONF_URL, ""))
+    port = data.get(CONF_PORT, 9192)
+    if path:
+        return f"{base_url}:{port}/{path}/api/calendar/ical/sharing-link"
+    return f"{base_url}:{port}/api/calendar/ical/sharing-link"
+
+
+@functools.lru_cache(maxsize=32)
+def _is_utc(tz: tzinfo) -> bool:
+    """Return whether a tzinfo is UTC, whichever library created it."""
+    return tz == UTC or str(tz) == "UTC" or (hasattr(tz, "zone") and tz.zone == "UTC")
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
+import requests
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigFlowResult
@@ -20,6 +22,7 @@ from .const import (
     CONF_PORT,
     CONF_URL,
     CONF_VERIFY_SSL,
+    DATA_CALENDAR_ICAL_URL,
     DEFAULT_CALENDAR_SYNC_INTERVAL,
     DEFAULT_PORT,
     DOMAIN,
@@ -30,51 +33,94 @@ from .helpers import extract_base_url_and_path
 _LOGGER = logging.getLogger(__name__)
 
 
+def _migrate_v1_to_v2(data: dict[str, Any]) -> dict[str, Any]:
+    """Add the calendar options introduced in version 2."""
+    return {
+        **data,
+        CONF_CALENDAR_SYNC_INTERVAL: DEFAULT_CALENDAR_SYNC_INTERVAL,
+        CONF_CALENDAR_FIX_TIMEZONE: True,
+    }
+
+
+# Config entry data migrations, keyed by the version they migrate from
+MIGRATIONS: dict[int, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    1: _migrate_v1_to_v2,
+}
+
+
 async def async_migrate_entry(
     hass: HomeAssistant, config_entry: config_entries.ConfigEntry
 ) -> bool:
     """Migrate old config entries."""
-    version = config_entry.version
-    if version == 1:
-        # Migrate from version 1 to 2: add calendar_sync_interval with default
-        new_data = {**config_entry.data}
-        new_data[CONF_CALENDAR_SYNC_INTERVAL] = DEFAULT_CALENDAR_SYNC_INTERVAL
-        new_data[CONF_CALENDAR_FIX_TIMEZONE] = True
-
-        hass.config_entries.async_update_entry(config_entry, data=new_data, version=2)
-        _LOGGER.info(
-            "Migrated config entry from version %s to version %s",
-            version,
-            2,
-        )
+    old_version = version = config_entry.version
+    if version not in MIGRATIONS:
+        # Already up to date, nothing to copy or write
+        return True
+
+    new_data = {**config_entry.data}
+    while version in MIGRATIONS:
+        new_data = MIGRATIONS[version](new_data)
+        version += 1
+
+    hass.config_entries.async_update_entry(config_entry, data=new_data, version=version)
+    _LOGGER.info(
+        "Migrated config entry from version %s to version %s",
+        old_version,
+        version,
+    )
     return True
 
 
-def _get_user_data_schema(
-    defaults: dict[str, Any] | None = None,
-) -> vol.Schema:
-    """Return the schema for user configuration form."""
-    defaults = defaults or {}
-    return vol.Schema(
-        {
-            vol.Required(CONF_URL, default=defaults.get(CONF_URL, "")): str,
-            vol.Required(CONF_API_KEY, default=defaults.get(CONF_API_KEY, "")): str,
-            vol.Optional(CONF_PORT, default=defaults.get(CONF_PORT, DEFAULT_PORT)): int,
-            vol.Optional(
-                CONF_VERIFY_SSL, default=defaults.get(CONF_VERIFY_SSL, False)
-            ): bool,
-            vol.Optional(
-                CONF_CALENDAR_SYNC_INTERVAL,
-                default=defaults.get(
-                    CONF_CALENDAR_SYNC_INTERVAL, DEFAULT_CALENDAR_SYNC_INTERVAL
-                ),
-            ): int,
-            vol.Optional(
-                CONF_CALENDAR_FIX_TIMEZONE,
-                default=defaults.get(CONF_CALENDAR_FIX_TIMEZONE, True),
-            ): bool,
-        }
-    )
+# The schemas are only built once, forms that are pre-filled from user input
+# or from the entry show their values as suggestions
+_DEFAULT_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_URL, default=""): str,
+        vol.Required(CONF_API_KEY, default=""): str,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+        vol.Optional(CONF_VERIFY_SSL, default=False): bool,
+        vol.Optional(
+            CONF_CALENDAR_SYNC_INTERVAL, default=DEFAULT_CALENDAR_SYNC_INTERVAL
+        ): int,
+        vol.Optional(CONF_CALENDAR_FIX_TIMEZONE, default=True): bool,
+    }
+)
+_REAUTH_DATA_SCHEMA = vol.Schema({vol.Required(CONF_API_KEY): str})
+
+
+async def _async_test_credentials(
+    hass: HomeAssistant, url: str, api_key: str, port: int, verify_ssl: bool
+) -> str | None:
+    """
+    Test if credentials are valid.
+
+    Returns None if valid, or an error key if invalid.
+    """
+    try:
+        (base_url, path) = extract_base_url_and_path(url)
+
+        _LOGGER.debug("Testing credentials")
+
+        def system_info():
+            """Get system information from Grocy."""
+            # Build the client in the executor too, setting up its session
+            # can block
+            client = Grocy(
+                base_url, api_key, port=port, path=path, verify_ssl=verify_ssl
+            )
+            return client.system.info()
+
+        await hass.async_add_executor_job(system_info)
+        return None
+    except (TimeoutError, requests.exceptions.Timeout) as error:
+        _LOGGER.error("Timeout error: %s", error)
+        return "timeout"
+    except (ConnectionError, requests.exceptions.ConnectionError) as error:
+        _LOGGER.error("Connection error: %s", error)
+        return "cannot_connect"
+    except Exception as error:  # pylint: disable=broad-except
+        _LOGGER.error("Authentication error: %s", error)
+        return "invalid_auth"
 
 
 class GrocyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -97,7 +143,7 @@ class GrocyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle a flow initialized by the user."""
-        self._errors = {}
+        self._errors.clear()
         _LOGGER.debug("Step user")
 
         if self._async_current_entries():
@@ -118,13 +164,15 @@ class GrocyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             self._errors["base"] = error
             return self.async_show_form(
                 step_id="user",
-                data_schema=_get_user_data_schema(user_input),
+                data_schema=self.add_suggested_values_to_schema(
+                    _DEFAULT_USER_DATA_SCHEMA, user_input
+                ),
                 errors=self._errors,
             )
 
         return self.async_show_form(
             step_id="user",
-            data_schema=_get_user_data_schema(),
+            data_schema=_DEFAULT_USER_DATA_SCHEMA,
             errors=self._errors,
         )
 
@@ -144,21 +192,26 @@ class GrocyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
             if error is None:
+                # Drop the cached iCal link, it belongs to the previous server
                 return self.async_update_reload_and_abort(
                     reconfigure_entry,
-                    data_updates=user_input,
+                    data_updates={**user_input, DATA_CALENDAR_ICAL_URL: None},
                 )
 
             self._errors["base"] = error
             return self.async_show_form(
                 step_id="reconfigure",
-                data_schema=_get_user_data_schema(user_input),
+                data_schema=self.add_suggested_values_to_schema(
+                    _DEFAULT_USER_DATA_SCHEMA, user_input
+                ),
                 errors=self._errors,
             )
 
         return self.async_show_form(
             step_id="reconfigure",
-            data_schema=_get_user_data_schema(dict(reconfigure_entry.data)),
+            data_schema=self.add_suggested_values_to_schema(
+                _DEFAULT_USER_DATA_SCHEMA, reconfigure_entry.data
+            ),
             errors=self._errors,
         )
 
@@ -191,11 +244,7 @@ class GrocyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_API_KEY): str,
-                }
-            ),
+            data_schema=_REAUTH_DATA_SCHEMA,
             errors=self._errors,
             description_placeholders={
                 CONF_HOST: reauth_entry.data[CONF_URL],
@@ -205,34 +254,8 @@ class GrocyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     async def _test_credentials(
         self, url: str, api_key: str, port: int, verify_ssl: bool
     ) -> str | None:
-        """
-        Test if credentials are valid.
-
-        Returns None if valid, or an error key if invalid.
-        """
-        try:
-            (base_url, path) = extract_base_url_and_path(url)
-            client = Grocy(
-                base_url, api_key, port=port, path=path, verify_ssl=verify_ssl
-            )
-
-            _LOGGER.debug("Testing credentials")
-
-            def system_info():
-                """Get system information from Grocy."""
-                return client.system.info()
-
-            await self.hass.async_add_executor_job(system_info)
-            return None
-        except ConnectionError as error:
-            _LOGGER.error("Connection error: %s", error)
-            return "cannot_connect"
-        except TimeoutError as error:
-            _LOGGER.error("Timeout error: %s", error)
-            return "timeout"
-        except Exception as error:  # pylint: disable=broad-except
-            _LOGGER.error("Authentication error: %s", error)
-            return "invalid_auth"
+        """Test if credentials are valid."""
+        return await _async_test_credentials(self.hass, url, api_key, port, verify_ssl)
 
 
 class GrocyOptionsFlowHandler(config_entries.OptionsFlow):
@@ -272,7 +295,9 @@ class GrocyOptionsFlowHandler(config_entries.OptionsFlow):
                     self._errors["base"] = error
                     return self.async_show_form(
                         step_id="init",
-                        data_schema=_get_user_data_schema(user_input),
+                        data_schema=self.add_suggested_values_to_schema(
+                            _DEFAULT_USER_DATA_SCHEMA, user_input
+                        ),
                         errors=self._errors,
                     )
 
@@ -288,6 +313,9 @@ class GrocyOptionsFlowHandler(config_entries.OptionsFlow):
             new_data[CONF_CALENDAR_FIX_TIMEZONE] = user_input.get(
                 CONF_CALENDAR_FIX_TIMEZONE, True
             )
+            if url_changed or api_key_changed or port_changed or verify_ssl_changed:
+                # The cached iCal link may belong to the previous server
+                new_data.pop(DATA_CALENDAR_ICAL_URL, None)
 
             # Update the config entry
             self.hass.config_entries.async_update_entry(
@@ -301,38 +329,14 @@ class GrocyOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=_get_user_data_schema(dict(self.config_entry.data)),
+            data_schema=self.add_suggested_values_to_schema(
+                _DEFAULT_USER_DATA_SCHEMA, self.config_entry.data
+            ),
             errors=self._errors,
         )
 
     async def _test_credentials(
         self, url: str, api_key: str, port: int, verify_ssl: bool
     ) -> str | None:
-        """
-        Test if credentials are valid.
-
-        Returns None if valid, or an error key if invalid.
-        """
-        try:
-            (base_url, path) = extract_base_url_and_path(url)
-            client = Grocy(
-                base_url, api_key, port=port, path=path, verify_ssl=verify_ssl
-            )
-
-            _LOGGER.debug("Testing credentials")
-
-            def system_info():
-                """Get system information from Grocy."""
-                return client.system.info()
-
-            await self.hass.async_add_executor_job(system_info)
-            return None
-        except ConnectionError as error:
-            _LOGGER.error("Connection error: %s", error)
-            return "cannot_connect"
-        except TimeoutError as error:
-            _LOGGER.error("Timeout error: %s", error)
-            return "timeout"
-        except Exception as error:  # pylint: disable=broad-except
-            _LOGGER.error("Authentication error: %s", error)
-            return "invalid_auth"
+        """Test if credentials are valid."""
+        return await _async_test_credentials(self.hass, url, api_key, port, verify_ssl)
@@ -22,6 +22,9 @@ CONF_VERIFY_SSL: Final = "verify_ssl"
 CONF_CALENDAR_SYNC_INTERVAL: Final = "calendar_sync_interval"
 CONF_CALENDAR_FIX_TIMEZONE: Final = "calendar_fix_timezone"
 
+# Cached iCal sharing link stored on the config entry, not user configurable
+DATA_CALENDAR_ICAL_URL: Final = "calendar_ical_url"
+
 STARTUP_MESSAGE: Final = f"""
 -------------------------------------------------------------------
 {NAME}
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -30,7 +32,7 @@ from .helpers import MealPlanItemWrapper, extract_base_url_and_path
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class GrocyCoordinatorData:
     batteries: list[Battery] | None = None
     chores: list[Chore] | None = None
@@ -47,12 +49,20 @@ class GrocyCoordinatorData:
     tasks: list[Task] | None = None
 
     def __setitem__(self, key, value):
+        if key not in _COORDINATOR_DATA_KEYS:
+            raise KeyError(key)
         setattr(self, key, value)
 
     def __getitem__(self, key: str):
+        if key not in _COORDINATOR_DATA_KEYS:
+            raise KeyError(key)
         return getattr(self, key)
 
 
+# Only the data fields can be accessed by key, not methods or slot internals
+_COORDINATOR_DATA_KEYS = frozenset(field.name for field in fields(GrocyCoordinatorData))
+
+
 class GrocyDataUpdateCoordinator(DataUpdateCoordinator[GrocyCoordinatorData]):
     """Grocy data update coordinator."""
 
@@ -62,15 +72,15 @@ class GrocyDataUpdateCoordinator(DataUpdateCoordinator[GrocyCoordinatorData]):
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize Grocy data update coordinator."""
+        # Passing the entry makes Home Assistant call async_shutdown on unload
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
         )
 
-        self.config_entry = config_entry
-
         url = self.config_entry.data[CONF_URL]
         api_key = self.config_entry.data[CONF_API_KEY]
         port = self.config_entry.data[CONF_PORT]
@@ -85,16 +95,28 @@ class GrocyDataUpdateCoordinator(DataUpdateCoordinator[GrocyCoordinatorData]):
 
         self.available_entities: list[str] = []
         self.entities: list[Entity] = []
+        self._pending_update: asyncio.Future[list[Any]] | None = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel an update still waiting on Grocy and stop refreshing."""
+        if self._pending_update is not None:
+            self._pending_update.cancel()
+        await super().async_shutdown()
 
     async def _async_update_data(self) -> GrocyCoordinatorData:
         """Fetch data."""
-        data = GrocyCoordinatorData()
+        # Start from the previous data, so keys that are skipped or fail to
+        # update keep their last known value
+        previous = getattr(self, "data", None)
+        data = replace(previous) if previous is not None else GrocyCoordinatorData()
         errors: dict[str, Exception] = {}
-        successful_updates = 0
 
+        keys: dict[str, None] = {}
+        disabled: list[str] | None = [] if _LOGGER.isEnabledFor(logging.DEBUG) else None
         for entity in self.entities:
             if not entity.enabled:
-                _LOGGER.debug("Entity %s is disabled", entity.entity_id)
+                if disabled is not None:
+                    disabled.append(entity.entity_id)
                 continue
 
             # Skip calendar entity - it doesn't use coordinator data
@@ -104,19 +126,33 @@ class GrocyDataUpdateCoordinator(DataUpdateCoordinator[GrocyCoordinatorData]):
             ):
                 continue
 
-            key = entity.entity_description.key
-            try:
-                data[key] = await self.grocy_data.async_update_data(key)
-                successful_updates += 1
-            except Exception as error:  # pylint: disable=broad-except
-                _LOGGER.error("Failed to update %s: %s", key, error)
-                errors[key] = error
-                previous = getattr(self, "data", None)
-                if previous is not None:
-                    data[key] = previous[key]
+            keys[entity.entity_description.key] = None
+
+        if disabled:
+            _LOGGER.debug("Skipping disabled entities: %s", ", ".join(disabled))
+
+        # Fetch all keys concurrently so a refresh takes as long as the slowest
+        # request instead of the sum of all of them
+        self._pending_update = asyncio.gather(
+            *(self.grocy_data.async_update_data(key) for key in keys),
+            return_exceptions=True,
+        )
+        try:
+            results = await self._pending_update
+        finally:
+            self._pending_update = None
+
+        for key, result in zip(keys, results, strict=True):
+            if not isinstance(result, BaseException):
+                data[key] = result
+                continue
+            if not isinstance(result, Exception):
+                raise result
+            _LOGGER.error("Failed to update %s: %s", key, result)
+            errors[key] = result
 
         # Only raise UpdateFailed if every entity update failed
-        if errors and successful_updates == 0:
+        if errors and len(errors) == len(keys):
             raise UpdateFailed(f"All updates failed. Errors: {errors}")
 
         return data
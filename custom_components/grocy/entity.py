@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceEntryType
@@ -11,7 +11,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, NAME, VERSION
 from .coordinator import GrocyCoordinatorData, GrocyDataUpdateCoordinator
-from .json_encoder import CustomJSONEncoder
+from .json_encoder import to_json_native
 
 
 class GrocyEntity(CoordinatorEntity[GrocyDataUpdateCoordinator]):
@@ -28,12 +28,9 @@ class GrocyEntity(CoordinatorEntity[GrocyDataUpdateCoordinator]):
         self._attr_name = description.name
         self._attr_unique_id = f"{config_entry.entry_id}{description.key.lower()}"
         self.entity_description = description
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Grocy device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
+        self._attributes_cache: tuple[Any, dict[str, Any] | None] | None = None
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
             name=NAME,
             manufacturer=NAME,
             sw_version=VERSION,
@@ -44,12 +41,15 @@ class GrocyEntity(CoordinatorEntity[GrocyDataUpdateCoordinator]):
     def extra_state_attributes(self) -> GrocyCoordinatorData | None:
         """Return the extra state attributes."""
         data = self.coordinator.data[self.entity_description.key]
-        if data and hasattr(self.entity_description, "attributes_fn"):
-            return json.loads(
-                json.dumps(
-                    self.entity_description.attributes_fn(data),
-                    cls=CustomJSONEncoder,
-                )
-            )
-
-        return None
+        if not data or not hasattr(self.entity_description, "attributes_fn"):
+            return None
+
+        # The coordinator hands out new data objects on refresh, so the
+        # attributes only need converting once per object
+        cache = self._attributes_cache
+        if cache is not None and cache[0] is data:
+            return cache[1]
+
+        attributes = to_json_native(self.entity_description.attributes_fn(data))
+        self._attributes_cache = (data, attributes)
+        return attributes
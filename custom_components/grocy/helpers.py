@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import base64
+import functools
 from typing import Any
 from urllib.parse import urlparse
 
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
 from grocy.data_models.meal_items import MealPlanItem
 
+from .const import DOMAIN
+
+CALENDAR_STORAGE_VERSION = 1
+
+
+def calendar_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store caching the iCal feed of a config entry across restarts."""
+    return Store(hass, CALENDAR_STORAGE_VERSION, f"{DOMAIN}_calendar_{entry_id}")
+
 
+@functools.lru_cache(maxsize=32)
 def extract_base_url_and_path(url: str) -> tuple[str, str]:
     """Extract the base url and path from a given URL."""
     parsed_url = urlparse(url)
@@ -0,0 +1,252 @@
+"""Lightweight iCal parsing for the Grocy calendar feed."""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import date, datetime
+from typing import Any, NamedTuple
+
+import icalendar
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+_TEXT_ESCAPE_RE = re.compile(r"\\([\\;,nN])")
+_DATE_LENGTH = 8
+_DATETIME_LENGTH = 15
+_ISO_DATE_LENGTH = 10
+_VEVENT_PROPERTIES = frozenset(
+    ("SUMMARY", "DTSTART", "DTEND", "DESCRIPTION", "LOCATION", "UID")
+)
+
+
+class RawEvent(NamedTuple):
+    """The VEVENT fields used by the calendar entity, before any conversion."""
+
+    summary: str
+    start: date | datetime | None
+    end: date | datetime | None
+    description: str
+    location: str
+    uid: str
+
+
+def read_vevents(data: bytes) -> list[RawEvent]:
+    """
+    Return the VEVENTs of an iCal payload.
+
+    Grocy emits simple feeds, so a line scanner handles them without building
+    the full icalendar object graph. Anything the scanner does not understand
+    falls back to icalendar.
+    """
+    events = scan_vevents(data)
+    if events is None:
+        _LOGGER.debug("Falling back to icalendar to parse the iCal data")
+        events = walk_vevents(icalendar.Calendar.from_ical(data))
+    return events
+
+
+def walk_vevents(calendar: icalendar.Calendar) -> list[RawEvent]:
+    """Extract the VEVENTs from a calendar parsed by icalendar."""
+    events: list[RawEvent] = []
+    for component in calendar.walk("VEVENT"):
+        # Pick the properties out in one pass over the stored (upper case)
+        # names instead of a case-insensitive lookup per property
+        properties = {
+            name: value
+            for name, value in component.items()
+            if name in _VEVENT_PROPERTIES
+        }
+        start = properties.get("DTSTART")
+        end = properties.get("DTEND")
+        events.append(
+            RawEvent(
+                summary=_as_str(properties.get("SUMMARY", "")),
+                start=start.dt if start else None,
+                end=end.dt if end else None,
+                description=_as_str(properties.get("DESCRIPTION", "")),
+                location=_as_str(properties.get("LOCATION", "")),
+                uid=_as_str(properties.get("UID", "")),
+            )
+        )
+    return events
+
+
+def _as_str(value: Any) -> str:
+    """Return a property value as text without copying values that already are."""
+    # vText subclasses str, so only other value types need converting
+    return value if isinstance(value, str) else str(value)
+
+
+def scan_vevents(data: bytes) -> list[RawEvent] | None:
+    """
+    Scan the VEVENTs of an iCal payload line by line.
+
+    Returns None if the payload uses anything the scanner does not support.
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+    # Unfold continuation lines (a line break followed by a space or tab)
+    text = (
+        text.replace("\r\n ", "")
+        .replace("\r\n\t", "")
+        .replace("\n ", "")
+        .replace("\n\t", "")
+    )
+
+    events: list[RawEvent] = []
+    properties: dict[str, tuple[str, str]] | None = None
+    # Depth of components nested in the current VEVENT, e.g. VALARM
+    depth = 0
+
+    for raw_line in text.split("\n"):
+        line = raw_line.rstrip("\r")
+        if properties is None:
+            if line.upper() == "BEGIN:VEVENT":
+                properties = {}
+            continue
+
+        name, sep, value = line.partition(":")
+        if not sep or '"' in name:
+            return None
+        name, _, params = name.partition(";")
+        name = name.upper()
+
+        if name == "BEGIN":
+            depth += 1
+        elif name == "END":
+            if depth:
+                depth -= 1
+                continue
+            try:
+                events.append(_build_raw_event(properties))
+            except ValueError:
+                return None
+            properties = None
+        elif not depth:
+            properties.setdefault(name, (params, value))
+
+    if properties is not None:
+        # Truncated payload, let icalendar decide what to do with it
+        return None
+    return events
+
+
+def _build_raw_event(properties: dict[str, tuple[str, str]]) -> RawEvent:
+    """Build a raw event from the properties of a scanned VEVENT."""
+    start = properties.get("DTSTART")
+    end = properties.get("DTEND")
+    return RawEvent(
+        summary=_text_value(properties, "SUMMARY"),
+        start=_date_value(*start) if start else None,
+        end=_date_value(*end) if end else None,
+        description=_text_value(properties, "DESCRIPTION"),
+        location=_text_value(properties, "LOCATION"),
+        uid=_text_value(properties, "UID"),
+    )
+
+
+def _text_value(properties: dict[str, tuple[str, str]], name: str) -> str:
+    """Return the unescaped TEXT value of a property, or an empty string."""
+    if name not in properties:
+        return ""
+    value = properties[name][1]
+    if "\\" not in value:
+        return value
+    return _TEXT_ESCAPE_RE.sub(
+        lambda match: "\n" if match.group(1) in "nN" else match.group(1), value
+    )
+
+
+def _date_value(params: str, value: str) -> date | datetime:
+    """
+    Parse a DATE or DATE-TIME value.
+
+    Raises ValueError for values the scanner does not support.
+    """
+    parameters = {}
+    for param in params.split(";"):
+        if param:
+            key, _, param_value = param.partition("=")
+            parameters[key.upper()] = param_value
+
+    value_type = parameters.get("VALUE", "").upper()
+    if len(value) == _DATE_LENGTH and value_type in ("", "DATE"):
+        return date.fromisoformat(value)
+    if value_type not in ("", "DATE-TIME"):
+        raise ValueError(f"Unsupported date value: {value}")
+
+    if len(value) == _DATETIME_LENGTH + 1 and value.endswith("Z"):
+        # fromisoformat reads the trailing Z as UTC, no slicing needed
+        return datetime.fromisoformat(value)
+    if len(value) != _DATETIME_LENGTH or value[_DATE_LENGTH] != "T":
+        raise ValueError(f"Unsupported date-time value: {value}")
+
+    parsed = datetime.fromisoformat(value)
+    if tzid := parameters.get("TZID"):
+        time_zone = dt_util.get_time_zone(tzid)
+        if time_zone is None:
+            raise ValueError(f"Unknown time zone: {tzid}")
+        return parsed.replace(tzinfo=time_zone)
+    return parsed
+
+
+def dump_raw_events(events: list[RawEvent]) -> list[list[Any]]:
+    """Serialize raw events to JSON compatible lists."""
+    return [
+        [
+            event.summary,
+            _dump_date(event.start),
+            _dump_date(event.end),
+            event.description,
+            event.location,
+            event.uid,
+        ]
+        for event in events
+    ]
+
+
+def load_raw_events(data: list[list[Any]]) -> list[RawEvent]:
+    """Restore raw events serialized with dump_raw_events."""
+    return [
+        RawEvent(
+            summary=summary,
+            start=_load_date(start),
+            end=_load_date(end),
+            description=description,
+            location=location,
+            uid=uid,
+        )
+        for summary, start, end, description, location, uid in data
+    ]
+
+
+def _dump_date(value: date | datetime | None) -> str | None:
+    """
+    Serialize a DATE or DATE-TIME value, keeping its timezone.
+
+    The offset alone does not say which zone a TZID value was in, so the zone
+    key is appended in brackets, e.g. 2026-01-15T10:00:00+00:00[Europe/London].
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime) and (key := getattr(value.tzinfo, "key", None)):
+        return f"{value.isoformat()}[{key}]"
+    return value.isoformat()
+
+
+def _load_date(value: str | None) -> date | datetime | None:
+    """Restore a value serialized with _dump_date."""
+    if value is None:
+        return None
+    if len(value) == _ISO_DATE_LENGTH:
+        return date.fromisoformat(value)
+    value, _, key = value.partition("[")
+    parsed = datetime.fromisoformat(value)
+    if key and (time_zone := dt_util.get_time_zone(key.removesuffix("]"))):
+        return parsed.replace(tzinfo=time_zone)
+    return parsed
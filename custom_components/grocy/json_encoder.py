@@ -1,6 +1,7 @@
 """JSON encoder for Grocy."""
 
 import datetime
+import json
 from typing import Any
 
 from homeassistant.helpers.json import ExtendedJSONEncoder
@@ -15,3 +16,25 @@ class CustomJSONEncoder(ExtendedJSONEncoder):
             return o.isoformat()
 
         return super().default(o)
+
+
+_ENCODER = CustomJSONEncoder()
+
+
+def to_json_native(obj: Any) -> Any:
+    """
+    Convert an object to the JSON types it would round trip through.
+
+    Gives the same result as json.loads(json.dumps(obj, cls=CustomJSONEncoder))
+    without encoding to a string and parsing it back.
+    """
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    if isinstance(obj, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key): to_json_native(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [to_json_native(item) for item in obj]
+    return to_json_native(_ENCODER.default(obj))
@@ -14,42 +14,83 @@ Run: uv run python docs/check_coverage.py
 from __future__ import annotations
 
 import ast
+import hashlib
+import json
+import os
+import re
 import sys
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import yaml
 
+try:
+    # The libyaml loader parses the map several times faster than pure Python
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 ROOT = Path(__file__).resolve().parent.parent
 YAML_PATH = ROOT / "docs" / "test-feature-map.yaml"
 TESTS_DIR = ROOT / "tests"
+CACHE_PATH = ROOT / ".cache" / "check_coverage.json"
+# Bump when scan_test_file changes what it extracts, to drop stale results
+CACHE_VERSION = 2
+# Below this many files to parse, starting worker processes costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 32
+
+# Only files referencing pytest.mark.feature can carry feature markers
+_FEATURE_MARKER_RE = re.compile(rb"pytest\s*\.\s*mark\s*\.\s*feature")
+# Top-level test functions start at column 0. Triple quotes are matched too,
+# to tell when such a line is inside a string
+_TEST_FUNCTION_RE = re.compile(
+    rb"(\"\"\"|''')|^(?:async[ \t]+)?def[ \t]+(test_\w+)", re.M
+)
+_CLASS_RE = re.compile(rb"^class\b", re.M)
+
+# Most test functions carry one of a few feature combinations, so equal
+# feature sets are shared. Comparing a function's marker and YAML features
+# then usually succeeds on identity
+_FEATURE_SETS: dict[frozenset[str], frozenset[str]] = {}
+
+
+def _shared_features(features: Iterable[str]) -> frozenset[str]:
+    """Return the shared frozenset equal to the given features."""
+    key = frozenset(features)
+    return _FEATURE_SETS.setdefault(key, key)
 
 
 def load_yaml_map() -> dict:
     """Load and return the test-feature-map.yaml contents."""
-    with open(YAML_PATH) as f:
-        return yaml.safe_load(f)
+    with open(YAML_PATH, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)  # noqa: S506
 
 
 def _extract_marker_names(decorator_node: ast.expr) -> list[str]:
     """Extract feature names from a pytest.mark.feature(...) decorator AST node."""
-    # Match: @pytest.mark.feature("name")
-    if not isinstance(decorator_node, ast.Call):
+    # Match: @pytest.mark.feature("name"). This runs for every decorator, and
+    # AST node classes are never subclassed, so exact type checks are used
+    # instead of the slower isinstance
+    if type(decorator_node) is not ast.Call:
         return []
 
     func = decorator_node.func
     # pytest.mark.feature(...)
     if (
-        isinstance(func, ast.Attribute)
+        type(func) is ast.Attribute
         and func.attr == "feature"
-        and isinstance(func.value, ast.Attribute)
+        and type(func.value) is ast.Attribute
         and func.value.attr == "mark"
-        and isinstance(func.value.value, ast.Name)
+        and type(func.value.value) is ast.Name
         and func.value.value.id == "pytest"
     ):
         return [
             arg.value
             for arg in decorator_node.args
-            if isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+            if type(arg) is ast.Constant and isinstance(arg.value, str)
         ]
     return []
 
@@ -88,111 +129,259 @@ def scan_test_file(filepath: Path) -> dict[str, set[str]]:
     - Function-level @pytest.mark.feature() decorators
     - Class-level @pytest.mark.feature() decorators
     """
-    source = filepath.read_text()
+    return _scan_source(filepath.read_bytes(), filepath)
+
+
+def _scan_source(source: bytes, filepath: Path) -> dict[str, set[str]]:
+    """Scan the source of a test file, see scan_test_file."""
+    if not _FEATURE_MARKER_RE.search(source):
+        # No feature markers to resolve, so try to skip building the AST and
+        # only list the test functions
+        functions = _scan_test_names(source)
+        if functions is not None:
+            return functions
+    return _scan_ast(source, filepath)
+
+
+def _scan_test_names(source: bytes) -> dict[str, set[str]] | None:
+    """
+    List the test functions of a file without feature markers.
+
+    Only top-level functions are found this way. Returns None when the file
+    has classes, or a def line inside a triple-quoted string, as only the AST
+    can tell which of those functions pytest collects.
+    """
+    if _CLASS_RE.search(source):
+        return None
+
+    functions: dict[str, set[str]] = {}
+    # The quote that opened the string the scan is in, if any
+    open_quote = b""
+    for quote, name in _TEST_FUNCTION_RE.findall(source):
+        if not quote:
+            if open_quote:
+                return None
+            functions.setdefault(name.decode(), set())
+        elif not open_quote:
+            open_quote = quote
+        elif quote == open_quote:
+            open_quote = b""
+    # An unclosed string means the quotes were miscounted
+    return None if open_quote else functions
+
+
+def _scan_ast(source: bytes, filepath: Path) -> dict[str, set[str]]:
+    """Scan the source of a test file by walking its AST."""
     tree = ast.parse(source, filename=str(filepath))
 
-    result: dict[str, set[str]] = {}
     module_features: set[str] = set()
+    # Test functions with the class-level features they inherit. Module-level
+    # features are applied at the end, as pytestmark may follow the tests
+    test_functions: list[tuple[ast.FunctionDef | ast.AsyncFunctionDef, set[str]]] = []
 
-    # First pass: find module-level pytestmark
-    for node in ast.iter_child_nodes(tree):
+    # Single pass over the module: collect pytestmark, functions and classes
+    for node in tree.body:
         if isinstance(node, ast.Assign):
             module_features.update(_extract_pytestmark_features(node))
 
-    # Second pass: find functions and classes
-    for node in ast.iter_child_nodes(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+        elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
             if node.name.startswith("test_"):
-                func_features = set(module_features)
-                for dec in node.decorator_list:
-                    func_features.update(_extract_marker_names(dec))
-                result[node.name] = func_features
+                test_functions.append((node, set()))
 
         elif isinstance(node, ast.ClassDef):
             class_features: set[str] = set()
             # Class-level decorators
             for dec in node.decorator_list:
                 class_features.update(_extract_marker_names(dec))
-            # Class-level pytestmark attribute
+            # Class-level pytestmark attribute and methods in class
+            methods = []
             for item in node.body:
                 if isinstance(item, ast.Assign):
                     class_features.update(_extract_pytestmark_features(item))
+                elif isinstance(
+                    item, ast.FunctionDef | ast.AsyncFunctionDef
+                ) and item.name.startswith("test_"):
+                    methods.append(item)
+            test_functions.extend((method, class_features) for method in methods)
 
-            # Methods in class
-            for item in node.body:
-                if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
-                    if item.name.startswith("test_"):
-                        func_features = set(module_features) | set(class_features)
-                        for dec in item.decorator_list:
-                            func_features.update(_extract_marker_names(dec))
-                        result[item.name] = func_features
+    result: dict[str, set[str]] = {}
+    for func, inherited_features in test_functions:
+        func_features = module_features | inherited_features
+        for dec in func.decorator_list:
+            func_features.update(_extract_marker_names(dec))
+        result[func.name] = func_features
 
     return result
 
 
-def build_yaml_index(data: dict) -> dict[str, dict[str, set[str]]]:
+def _load_scan_cache() -> dict[str, dict]:
+    """Load the cached scan results of previous runs."""
+    try:
+        with open(CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def _save_scan_cache(files: dict[str, dict]) -> None:
+    """Atomically replace the scan cache."""
+    CACHE_PATH.parent.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=CACHE_PATH.parent, suffix=".tmp", delete=False
+    ) as f:
+        json.dump({"version": CACHE_VERSION, "files": files}, f)
+    os.replace(f.name, CACHE_PATH)
+
+
+def scan_test_files(
+    test_files: list[Path],
+) -> dict[Path, dict[str, frozenset[str]]]:
     """
-    Build {file: {function: {features}}} from YAML data.
+    Scan test files, reusing the results of files unchanged since the last run.
 
-    Returns mapping of relative file path -> function name -> set of feature names.
+    Results are cached in .cache/check_coverage.json keyed by the file's
+    relative path and the SHA-1 of its contents.
     """
-    index: dict[str, dict[str, set[str]]] = {}
+    cache = _load_scan_cache()
+    new_cache: dict[str, dict] = {}
+    results: dict[Path, dict[str, frozenset[str]]] = {}
+    to_scan: list[tuple[Path, bytes]] = []
+
+    for test_file in test_files:
+        rel_path = test_file.relative_to(ROOT).as_posix()
+        source = test_file.read_bytes()
+        digest = hashlib.sha1(source).hexdigest()
+        new_cache[rel_path] = {"sha1": digest}
+
+        cached = cache.get(rel_path)
+        if cached is not None and cached.get("sha1") == digest:
+            results[test_file] = {
+                name: _shared_features(features)
+                for name, features in cached["functions"].items()
+            }
+        else:
+            # Keep the results in file order, scanned files are filled in below
+            results[test_file] = {}
+            to_scan.append((test_file, source))
+
+    scanned_files = [test_file for test_file, _ in to_scan]
+    sources = [source for _, source in to_scan]
+    if len(to_scan) >= PARALLEL_SCAN_MIN_FILES:
+        # Parsing is CPU bound, spread it over processes once there are
+        # enough files to pay for starting them
+        with ProcessPoolExecutor() as executor:
+            chunksize = max(1, len(to_scan) // (4 * (os.cpu_count() or 1)))
+            scanned = list(
+                executor.map(_scan_source, sources, scanned_files, chunksize=chunksize)
+            )
+    else:
+        scanned = list(map(_scan_source, sources, scanned_files))
+
+    for test_file, functions in zip(scanned_files, scanned, strict=True):
+        results[test_file] = {
+            name: _shared_features(features) for name, features in functions.items()
+        }
+
+    for test_file, functions in results.items():
+        new_cache[test_file.relative_to(ROOT).as_posix()]["functions"] = {
+            name: sorted(features) for name, features in functions.items()
+        }
+
+    if new_cache != cache:
+        try:
+            _save_scan_cache(new_cache)
+        except OSError as error:
+            print(f"Could not write {CACHE_PATH}: {error}", file=sys.stderr)
+
+    return results
+
+
+def list_test_files() -> list[Path]:
+    """Return the test modules in TESTS_DIR, sorted by name."""
+    # The directory listing already says whether an entry is a file, so no
+    # stat call per match is needed
+    with os.scandir(TESTS_DIR) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith("test_")
+            and entry.name.endswith(".py")
+            and entry.is_file()
+        )
+
 
-    all_features = {}
+def collect_feature_sources(data: dict) -> dict[str, dict]:
+    """Merge the feature groups and the cross-cutting group of the YAML data."""
+    feature_sources: dict[str, dict] = {}
     if "features" in data:
-        all_features.update(data["features"])
+        feature_sources.update(data["features"])
     if "cross_cutting" in data:
-        all_features["cross_cutting"] = data["cross_cutting"]
+        feature_sources["cross_cutting"] = data["cross_cutting"]
+    return feature_sources
 
-    for feature_key, feature_data in all_features.items():
-        for test_entry in feature_data.get("tests", []):
-            filepath = test_entry["file"]
-            if filepath not in index:
-                index[filepath] = {}
-            for func_name in test_entry.get("functions", []):
-                if func_name not in index[filepath]:
-                    index[filepath][func_name] = set()
-                index[filepath][func_name].add(feature_key)
 
-    return index
+def build_yaml_index(
+    feature_sources: dict[str, dict],
+) -> tuple[dict[str, dict[str, frozenset[str]]], dict[str, int]]:
+    """
+    Build {file: {function: {features}}} and the test count of each feature.
+
+    Returns mapping of relative file path -> function name -> set of feature
+    names, and mapping of feature name -> number of mapped test functions.
+    """
+    index: defaultdict[str, defaultdict[str, set[str]]] = defaultdict(
+        lambda: defaultdict(set)
+    )
+    counts: dict[str, int] = {}
+
+    for feature_key, feature_data in feature_sources.items():
+        count = 0
+        for test_entry in feature_data.get("tests", []):
+            file_index = index[test_entry["file"]]
+            functions = test_entry.get("functions", ())
+            count += len(functions)
+            for func_name in functions:
+                file_index[func_name].add(feature_key)
+        counts[feature_key] = count
+
+    frozen_index = {
+        filepath: {
+            func_name: _shared_features(features)
+            for func_name, features in file_index.items()
+        }
+        for filepath, file_index in index.items()
+    }
+    return frozen_index, counts
 
 
 def main() -> int:
     data = load_yaml_map()
-    yaml_index = build_yaml_index(data)
+    feature_sources = collect_feature_sources(data)
+    yaml_index, all_features = build_yaml_index(feature_sources)
 
     errors: list[str] = []
     warnings: list[str] = []
 
-    # Collect all features and their test counts
-    all_features: dict[str, int] = {}
-    feature_sources = {}
-    if "features" in data:
-        feature_sources.update(data["features"])
-    if "cross_cutting" in data:
-        feature_sources["cross_cutting"] = data["cross_cutting"]
-
-    for feature_key, feature_data in feature_sources.items():
-        count = sum(
-            len(entry.get("functions", [])) for entry in feature_data.get("tests", [])
-        )
-        all_features[feature_key] = count
-
     # Check 1: Features without tests
     for feature_key, count in all_features.items():
         if count == 0:
             errors.append(f"Feature '{feature_key}' has no tests mapped in YAML")
 
     # Check 2 & 3: Compare YAML map with actual markers in test files
-    all_test_files = sorted(TESTS_DIR.glob("test_*.py"))
+    all_test_files = list_test_files()
     yaml_only: list[str] = []  # in YAML but no marker
     marker_only: list[str] = []  # has marker but not in YAML
     mismatched: list[str] = []  # both exist but features differ
 
-    for test_file in all_test_files:
+    for test_file, actual_markers in scan_test_files(all_test_files).items():
         rel_path = f"tests/{test_file.name}"
-        actual_markers = scan_test_file(test_file)
         yaml_functions = yaml_index.get(rel_path, {})
+        if not yaml_functions and not any(actual_markers.values()):
+            # Neither mapped nor marked, so there is nothing to compare
+            continue
 
         # Functions in YAML but not in file
         for func_name in yaml_functions:
@@ -203,7 +392,7 @@ def main() -> int:
 
         # Check each actual test function
         for func_name, marker_features in actual_markers.items():
-            yaml_features = yaml_functions.get(func_name, set())
+            yaml_features = yaml_functions.get(func_name, frozenset())
 
             if marker_features and not yaml_features:
                 marker_only.append(
@@ -226,55 +415,57 @@ def main() -> int:
         if filepath not in existing_files:
             errors.append(f"YAML references non-existent file: {filepath}")
 
-    # Report
-    print("=" * 60)
-    print("Feature Coverage Validation Report")
-    print("=" * 60)
+    # Report, written in one go once complete
+    out: list[str] = []
+    out.append("=" * 60)
+    out.append("Feature Coverage Validation Report")
+    out.append("=" * 60)
 
     # Summary table
-    print("\nFeature Test Counts:")
-    print("-" * 40)
+    out.append("\nFeature Test Counts:")
+    out.append("-" * 40)
     total = 0
     for feature_key in sorted(all_features):
         count = all_features[feature_key]
         total += count
         name = feature_sources[feature_key].get("name", feature_key)
-        print(f"  {name:<30s} {count:>4d}")
-    print("-" * 40)
-    print(f"  {'Total (with overlap)':<30s} {total:>4d}")
+        out.append(f"  {name:<30s} {count:>4d}")
+    out.append("-" * 40)
+    out.append(f"  {'Total (with overlap)':<30s} {total:>4d}")
 
     # Unique test count
     unique_tests: set[str] = set()
     for filepath, funcs in yaml_index.items():
         for func_name in funcs:
             unique_tests.add(f"{filepath}::{func_name}")
-    print(f"  {'Unique test functions':<30s} {len(unique_tests):>4d}")
+    out.append(f"  {'Unique test functions':<30s} {len(unique_tests):>4d}")
 
     if errors:
-        print(f"\nErrors ({len(errors)}):")
+        out.append(f"\nErrors ({len(errors)}):")
         for e in errors:
-            print(f"  [ERROR] {e}")
+            out.append(f"  [ERROR] {e}")
 
     if yaml_only:
-        print(f"\nIn YAML but missing marker ({len(yaml_only)}):")
+        out.append(f"\nIn YAML but missing marker ({len(yaml_only)}):")
         for item in yaml_only:
-            print(item)
+            out.append(item)
 
     if marker_only:
-        print(f"\nHas marker but not in YAML ({len(marker_only)}):")
+        out.append(f"\nHas marker but not in YAML ({len(marker_only)}):")
         for item in marker_only:
-            print(item)
+            out.append(item)
 
     if mismatched:
-        print(f"\nFeature mismatch ({len(mismatched)}):")
+        out.append(f"\nFeature mismatch ({len(mismatched)}):")
         for item in mismatched:
-            print(item)
+            out.append(item)
 
     if not errors and not yaml_only and not marker_only and not mismatched:
-        print("\nAll checks passed!")
+        out.append("\nAll checks passed!")
 
     has_issues = bool(errors or yaml_only or marker_only or mismatched)
-    print(f"\nStatus: {'FAIL' if has_issues else 'OK'}")
+    out.append(f"\nStatus: {'FAIL' if has_issues else 'OK'}")
+    sys.stdout.write("\n".join(out) + "\n")
     return 1 if has_issues else 0
 
 
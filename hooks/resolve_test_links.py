@@ -11,39 +11,63 @@ from __future__ import annotations
 
 import logging
 import re
-from functools import lru_cache
 from pathlib import Path
 
 log = logging.getLogger("mkdocs.hooks.resolve_test_links")
 
 # Matches a table row with: | tests/some_file.py | `test_function_name` | ...  |
+# The whole page is scanned at once, so whitespace must not cross a line break
 _ROW_RE = re.compile(
     r"^\|"
-    r"\s*(tests/\S+\.py)\s*"  # group 1: file path
+    r"[^\S\n]*(tests/\S+\.py)[^\S\n]*"  # group 1: file path
     r"\|"
-    r"\s*`([^`]+)`\s*"  # group 2: function name (backtick-wrapped)
+    r"[^\S\n]*`([^`\n]+)`[^\S\n]*"  # group 2: function name (backtick-wrapped)
     r"\|"
     r"(.*)\|$",  # group 3: rest of the row
+    re.MULTILINE,
 )
 
 
-@lru_cache(maxsize=128)
-def _read_lines(path: Path) -> tuple[str, ...]:
-    """Read and cache file lines (tuple for hashability)."""
+# Matches a function definition and captures its name. Files are searched as
+# a whole, so whitespace must not cross a line break
+_DEF_RE = re.compile(
+    rb"^[^\S\n]*(?:async[^\S\n]+)?def[^\S\n]+(\w+)[^\S\n]*\(", re.MULTILINE
+)
+
+# path -> (mtime_ns, {function name: line number}); a file is indexed again
+# only after it changed, so `mkdocs serve` picks up edited tests while a build
+# reads each file once
+_INDEX_CACHE: dict[Path, tuple[int, dict[str, int]]] = {}
+
+
+def _function_line_index(path: Path) -> dict[str, int]:
+    """Return the 1-based line number of each function defined in a file."""
     try:
-        return tuple(path.read_text().splitlines())
+        mtime_ns = path.stat().st_mtime_ns
+        cached = _INDEX_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        data = path.read_bytes()
     except OSError:
         log.warning("Could not read %s", path)
-        return ()
+        return {}
+
+    # Search the raw bytes and count line breaks between matches, rather
+    # than decoding the file and splitting it into a list of lines
+    index: dict[str, int] = {}
+    line_number = 1
+    pos = 0
+    for m in _DEF_RE.finditer(data):
+        line_number += data.count(b"\n", pos, m.start())
+        pos = m.start()
+        index.setdefault(m.group(1).decode(), line_number)
+    _INDEX_CACHE[path] = (mtime_ns, index)
+    return index
 
 
 def _find_line_number(file_path: Path, func_name: str) -> int | None:
     """Return the 1-based line number where ``def <func_name>`` appears."""
-    pattern = f"def {func_name}("
-    for i, line in enumerate(_read_lines(file_path), start=1):
-        if pattern in line:
-            return i
-    return None
+    return _function_line_index(file_path).get(func_name)
 
 
 def _get_repo_url(config: dict) -> str | None:
@@ -76,35 +100,26 @@ def on_page_markdown(
 
     branch = _get_branch(config)
     project_root = Path(config["docs_dir"]).parent
-    lines = markdown.split("\n")
-    result = []
-
-    for line in lines:
-        m = _ROW_RE.match(line)
-        if m:
-            file_rel = m.group(1)
-            func_name = m.group(2)
-            rest = m.group(3)
-
-            file_path = project_root / file_rel
-            line_num = _find_line_number(file_path, func_name)
-
-            if line_num is not None:
-                file_url = f"{repo_url}/blob/{branch}/{file_rel}#L{line_num}"
-                func_url = f"{repo_url}/blob/{branch}/{file_rel}#L{line_num}"
-                result.append(
-                    f"| [{file_rel}]({file_url})"
-                    f" | [`{func_name}`]({func_url})"
-                    f" |{rest}|"
-                )
-            else:
-                log.warning(
-                    "Could not find def %s in %s",
-                    func_name,
-                    file_rel,
-                )
-                result.append(line)
-        else:
-            result.append(line)
-
-    return "\n".join(result)
+
+    def _link_row(m: re.Match[str]) -> str:
+        file_rel = m.group(1)
+        func_name = m.group(2)
+        rest = m.group(3)
+
+        file_path = project_root / file_rel
+        line_num = _find_line_number(file_path, func_name)
+
+        if line_num is None:
+            log.warning(
+                "Could not find def %s in %s",
+                func_name,
+                file_rel,
+            )
+            return m.group(0)
+
+        file_url = f"{repo_url}/blob/{branch}/{file_rel}#L{line_num}"
+        func_url = f"{repo_url}/blob/{branch}/{file_rel}#L{line_num}"
+        return f"| [{file_rel}]({file_url}) | [`{func_name}`]({func_url}) |{rest}|"
+
+    # Let the regex engine find the rows instead of matching line by line
+    return _ROW_RE.sub(_link_row, markdown)
@@ -3,8 +3,12 @@
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import orjson
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -13,17 +17,39 @@ logger = logging.getLogger(__name__)
 TRANSLATIONS_DIR = Path("custom_components/grocy/translations")
 
 
-def get_keys(obj, prefix=""):
+def get_keys(obj):
     """Get all nested keys as dot notation."""
     keys = set()
-    for key, value in obj.items():
-        full_key = f"{prefix}.{key}" if prefix else key
-        keys.add(full_key)
-        if isinstance(value, dict):
-            keys.update(get_keys(value, full_key))
+    # Walk the nested dicts with an explicit stack instead of recursing and
+    # merging a new set per level
+    stack = [(obj, "")]
+    while stack:
+        current, prefix = stack.pop()
+        for key, value in current.items():
+            full_key = f"{prefix}{key}"
+            keys.add(full_key)
+            if isinstance(value, dict):
+                stack.append((value, f"{full_key}."))
     return keys
 
 
+def _check_and_reorder(file, base_keys):
+    """Return the missing and unknown keys of a translation file and reorder it."""
+    data = orjson.loads(file.read_bytes())
+
+    file_keys = get_keys(data)
+    missing = base_keys - file_keys
+    extra = file_keys - base_keys
+
+    # Reorder and save, orjson only indents by two spaces so keep json here
+    output = json.dumps(data, indent=4, ensure_ascii=False, sort_keys=True)
+    output = output.replace("/", "\\/")
+    with file.open("w") as f:
+        f.write(output + "\n")
+
+    return missing, extra
+
+
 def main():
     """Validate translation files and reorder their contents."""
     en_file = TRANSLATIONS_DIR / "en.json"
@@ -32,21 +58,18 @@ def main():
         logger.error("No en.json found at %s", en_file)
         sys.exit(1)
 
-    with en_file.open() as f:
-        base_keys = get_keys(json.load(f))
+    base_keys = get_keys(orjson.loads(en_file.read_bytes()))
 
-    all_valid = True
-    for file in TRANSLATIONS_DIR.glob("*.json"):
-        if file.name == "en.json":
-            continue
-
-        with file.open() as f:
-            data = json.load(f)
-
-        file_keys = get_keys(data)
-        missing = base_keys - file_keys
-        extra = file_keys - base_keys
+    files = sorted(
+        file for file in TRANSLATIONS_DIR.glob("*.json") if file.name != "en.json"
+    )
+    # The files are independent and mostly I/O, so handle them in threads and
+    # report in file order once they are all done
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(partial(_check_and_reorder, base_keys=base_keys), files)
 
+    all_valid = True
+    for file, (missing, extra) in zip(files, results, strict=True):
         for key in sorted(missing):
             logger.error("Missing translation %s for %s", key, file.name)
             all_valid = False
@@ -55,12 +78,6 @@ def main():
             logger.error("Unknown translation %s for %s", key, file.name)
             all_valid = False
 
-        # Reorder and save
-        output = json.dumps(data, indent=4, ensure_ascii=False, sort_keys=True)
-        output = output.replace("/", "\\/")
-        with file.open("w") as f:
-            f.write(output + "\n")
-
     sys.exit(0 if all_valid else 1)
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from types import SimpleNamespace
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -54,19 +55,22 @@ def pytest_collection_modifyitems(config, items):
     items[:] = selected
 
 
-@pytest.fixture(name="config_entry_data")
-def config_entry_data_fixture() -> dict[str, object]:
-    return {
-        CONF_URL: "https://demo.grocy.info",
-        CONF_API_KEY: "test-token",
-        CONF_PORT: 9192,
-        CONF_VERIFY_SSL: False,
-    }
+# Shared by the whole session, so the mapping is read-only
+@pytest.fixture(name="config_entry_data", scope="session")
+def config_entry_data_fixture() -> Mapping[str, object]:
+    return MappingProxyType(
+        {
+            CONF_URL: "https://demo.grocy.info",
+            CONF_API_KEY: "test-token",
+            CONF_PORT: 9192,
+            CONF_VERIFY_SSL: False,
+        }
+    )
 
 
 @pytest.fixture(name="mock_config_entry")
 def mock_config_entry_fixture(
-    config_entry_data: dict[str, object],
+    config_entry_data: Mapping[str, object],
 ) -> MockConfigEntry:
     entry = MockConfigEntry(
         domain=DOMAIN,
@@ -79,47 +83,25 @@ def mock_config_entry_fixture(
 
 @pytest.fixture(name="mock_grocy")
 def mock_grocy_fixture() -> MagicMock:
+    # Only configure return values here; MagicMock creates the API objects and
+    # call-recording methods lazily, when a test actually touches them
     mock_client = MagicMock()
     mock_client.system.info.return_value = {"id": 1}
     mock_client.system.config.return_value = MagicMock(
         enabled_features={"FEATURE_FLAG_STOCK", "FEATURE_FLAG_TASKS"}
     )
 
-    stock_api = MagicMock()
-    stock_api._api = MagicMock()
+    stock_api = mock_client.stock
     stock_api._api.get_stock.return_value = []
     stock_api.due_products.return_value = []
     stock_api.expired_products.return_value = []
     stock_api.overdue_products.return_value = []
     stock_api.missing_products.return_value = []
-    mock_client.stock = stock_api
-
-    chores_api = MagicMock()
-    chores_api.list.return_value = []
-    mock_client.chores = chores_api
-
-    tasks_api = MagicMock()
-    tasks_api.list.return_value = []
-    tasks_api.complete = MagicMock()
-    mock_client.tasks = tasks_api
-
-    shopping_api = MagicMock()
-    shopping_api.items.return_value = []
-    shopping_api.remove_product = MagicMock()
-    shopping_api.add_missing_products = MagicMock()
-    mock_client.shopping_list = shopping_api
-
-    recipes_api = MagicMock()
-    recipes_api.consume = MagicMock()
-    mock_client.recipes = recipes_api
-
-    batteries_api = MagicMock()
-    batteries_api.list.return_value = []
-    batteries_api.charge = MagicMock()
-    mock_client.batteries = batteries_api
-
-    generic_api = MagicMock()
-    mock_client.generic = generic_api
+
+    mock_client.chores.list.return_value = []
+    mock_client.tasks.list.return_value = []
+    mock_client.shopping_list.items.return_value = []
+    mock_client.batteries.list.return_value = []
 
     return mock_client
 
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import datetime as dt
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from types import SimpleNamespace
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyRecipe:
     id: int = 1
     name: str = "Recipe"
@@ -14,15 +14,10 @@ class DummyRecipe:
     picture_file_name: str | None = "recipe.jpg"
 
     def as_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "picture_file_name": self.picture_file_name,
-        }
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyMealPlanItem:
     id: int = 1
     day: dt.date = field(default_factory=lambda: dt.date.today() + dt.timedelta(days=1))
@@ -36,7 +31,7 @@ class DummyMealPlanItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyChore:
     id: int = 1
     name: str = "Chore"
@@ -47,16 +42,10 @@ class DummyChore:
     track_date_only: bool = False
 
     def as_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "next_estimated_execution_time": self.next_estimated_execution_time,
-            "track_date_only": self.track_date_only,
-        }
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyBattery:
     id: int = 1
     name: str = "Battery"
@@ -66,15 +55,10 @@ class DummyBattery:
     )
 
     def as_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "next_estimated_charge_time": self.next_estimated_charge_time,
-        }
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyTask:
     id: int = 1
     name: str = "Task"
@@ -82,15 +66,10 @@ class DummyTask:
     due_date: dt.date | None = field(default_factory=lambda: dt.date.today())
 
     def as_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "due_date": self.due_date,
-        }
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyProduct:
     id: int = 1
     name: str = "Product"
@@ -99,27 +78,21 @@ class DummyProduct:
     best_before_date: dt.datetime | None = None
 
     def as_dict(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "available_amount": self.available_amount,
-            "description": self.description,
-            "best_before_date": self.best_before_date,
-        }
+        return asdict(self)
 
     def get_details(self, api_client) -> None:
         """No-op for tests; real Product.get_details fetches from API."""
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyCurrentStockProduct:
     picture_file_name: str | None = "product.jpg"
 
     def as_dict(self) -> dict[str, Any]:
-        return {"picture_file_name": self.picture_file_name}
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyCurrentStockResponse:
     product: DummyCurrentStockProduct = field(default_factory=DummyCurrentStockProduct)
     available_amount: float = 1.0
@@ -131,15 +104,15 @@ class DummyCurrentStockResponse:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyShoppingProduct:
     name: str = "Listed product"
 
     def as_dict(self) -> dict[str, Any]:
-        return {"name": self.name}
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyShoppingListProduct:
     id: int = 1
     amount: float = 2.0
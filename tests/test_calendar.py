@@ -6,15 +6,16 @@ See: docs/FEATURES.md#7-calendar
 
 from __future__ import annotations
 
+import functools
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from zoneinfo import ZoneInfo
 
-import icalendar
 import pytest
 from homeassistant.components.calendar import CalendarEvent
 from homeassistant.util import dt as dt_util
+from multidict import CIMultiDict
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.grocy.calendar import GrocyCalendarEntity
@@ -25,14 +26,41 @@ from custom_components.grocy.const import (
     CONF_PORT,
     CONF_URL,
     CONF_VERIFY_SSL,
+    DATA_CALENDAR_ICAL_URL,
     DOMAIN,
 )
+from custom_components.grocy.helpers import calendar_store
+
+BERLIN = ZoneInfo("Europe/Berlin")
+PACIFIC = ZoneInfo("America/Los_Angeles")
+# Range most tests request events for
+FEBRUARY_START = datetime(2026, 2, 1, tzinfo=BERLIN)
+FEBRUARY_END = datetime(2026, 2, 28, tzinfo=BERLIN)
+
+
+class MockResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    __slots__ = ("_body", "headers", "status")
+
+    def __init__(self, body: bytes, status: int, headers: dict[str, str]) -> None:
+        """Initialize with the response body, status and headers."""
+        self._body = body
+        self.status = status
+        # aiohttp headers are case-insensitive, e.g. hdrs.ETAG is "Etag"
+        self.headers = CIMultiDict(headers)
+
+    async def read(self) -> bytes:
+        """Return the response body."""
+        return self._body
 
 
 class MockAsyncContextManager:
     """Mock async context manager for aiohttp session.get()."""
 
-    def __init__(self, mock_response: MagicMock) -> None:
+    __slots__ = ("mock_response",)
+
+    def __init__(self, mock_response: MockResponse) -> None:
         """Initialize with a mock response."""
         self.mock_response = mock_response
 
@@ -45,26 +73,34 @@ class MockAsyncContextManager:
         return False
 
 
-def _create_mock_session(ical_data: str, status: int = 200) -> MagicMock:
-    """Create a properly mocked aiohttp session for calendar tests."""
-    mock_response = MagicMock()
-    mock_response.status = status
-    # Use a regular function that returns a coroutine for text()
-    async def mock_text():
-        return ical_data
-    mock_response.text = mock_text
+class MockSession:
+    """Minimal stand-in for an aiohttp session that records its requests."""
+
+    __slots__ = ("_response", "requests")
+
+    def __init__(self, response: MockResponse) -> None:
+        """Initialize with the response returned for every request."""
+        self._response = response
+        self.requests: list[tuple[str, dict]] = []
+
+    def get(self, url: str, **kwargs) -> MockAsyncContextManager:
+        """Record the request and return the response context manager."""
+        self.requests.append((url, kwargs))
+        return MockAsyncContextManager(self._response)
 
-    session = MagicMock()
-    session.get.return_value = MockAsyncContextManager(mock_response)
-    return session
+
+def _create_mock_session(
+    ical_data: str, status: int = 200, headers: dict[str, str] | None = None
+) -> MockSession:
+    """Create a mocked aiohttp session for calendar tests."""
+    return MockSession(MockResponse(ical_data.encode("utf-8"), status, headers or {}))
 
 
 @pytest.fixture(name="mock_coordinator")
-def mock_coordinator_fixture() -> MagicMock:
+def mock_coordinator_fixture() -> SimpleNamespace:
     """Create a mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.entities = []
-    return coordinator
+    # The calendar entity only stores its coordinator, so no MagicMock is needed
+    return SimpleNamespace(entities=[])
 
 
 @pytest.fixture(name="calendar_config_entry_data")
@@ -93,6 +129,27 @@ def calendar_config_entry_fixture(
     )
 
 
+def _ical_text(value: str) -> str:
+    """Escape an iCal TEXT value."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _ical_datetime(name: str, value: datetime, tzid: str | None) -> str:
+    """Render a DATE-TIME property the way icalendar writes it."""
+    if tzid is None and value.tzinfo not in (None, UTC):
+        tzid = value.tzinfo.key
+    if tzid:
+        return f"{name};TZID={tzid}:{value:%Y%m%dT%H%M%S}"
+    if value.tzinfo is None:
+        return f"{name}:{value:%Y%m%dT%H%M%S}"
+    return f"{name}:{value:%Y%m%dT%H%M%S}Z"
+
+
 def _create_ical_event(
     summary: str,
     start: datetime | None = None,
@@ -101,8 +158,8 @@ def _create_ical_event(
     end_date: str | None = None,
     uid: str = "test-uid",
     tzid: str | None = None,
-) -> icalendar.Event:
-    """Create an iCal event for testing.
+) -> str:
+    """Create the VEVENT lines of an iCal event for testing.
 
     Args:
         summary: Event summary/title
@@ -114,42 +171,56 @@ def _create_ical_event(
         tzid: Timezone ID for datetime events
 
     """
-    event = icalendar.Event()
-    event.add("summary", summary)
-    event.add("uid", uid)
+    lines = ["BEGIN:VEVENT", f"SUMMARY:{_ical_text(summary)}"]
 
     if start is not None:
-        if tzid:
-            event.add("dtstart", start, parameters={"TZID": tzid})
-        else:
-            event.add("dtstart", start)
+        lines.append(_ical_datetime("DTSTART", start, tzid))
 
     if end is not None:
-        if tzid:
-            event.add("dtend", end, parameters={"TZID": tzid})
-        else:
-            event.add("dtend", end)
+        lines.append(_ical_datetime("DTEND", end, tzid))
 
     if start_date is not None:
         # All-day event with date only
-        dt_start = icalendar.vDate.from_ical(start_date)
-        event.add("dtstart", dt_start)
+        lines.append(f"DTSTART;VALUE=DATE:{start_date}")
 
     if end_date is not None:
-        dt_end = icalendar.vDate.from_ical(end_date)
-        event.add("dtend", dt_end)
+        lines.append(f"DTEND;VALUE=DATE:{end_date}")
 
-    return event
+    lines.extend((f"UID:{_ical_text(uid)}", "END:VEVENT"))
+    return "\r\n".join(lines)
 
 
-def _create_ical_calendar(events: list[icalendar.Event]) -> str:
+def _create_ical_calendar(events: list[str]) -> str:
     """Create an iCal calendar string from events."""
-    cal = icalendar.Calendar()
-    cal.add("prodid", "-//Test//Test//EN")
-    cal.add("version", "2.0")
-    for event in events:
-        cal.add_component(event)
-    return cal.to_ical().decode("utf-8")
+    return "\r\n".join(
+        (
+            "BEGIN:VCALENDAR",
+            "PRODID:-//Test//Test//EN",
+            "VERSION:2.0",
+            *events,
+            "END:VCALENDAR",
+            "",
+        )
+    )
+
+
+@functools.lru_cache
+def _create_ical_feed(
+    summary: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    uid: str = "test-uid",
+    tzid: str | None = None,
+) -> str:
+    """Create an iCal calendar string holding a single event.
+
+    Feeds are cached, so tests describing the same event share one string.
+    """
+    return _create_ical_calendar(
+        [_create_ical_event(summary, start, end, start_date, end_date, uid, tzid)]
+    )
 
 
 @pytest.mark.feature("calendar")
@@ -170,7 +241,7 @@ class TestCalendarEntityTimezoneFixEnabled:
         """
         # Set up Home Assistant with a specific timezone
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
@@ -179,20 +250,19 @@ class TestCalendarEntityTimezoneFixEnabled:
         # Create event at 14:00 UTC (which is actually 14:00 local time from Grocy addon)
         event_start_utc = datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC)
         event_end_utc = datetime(2026, 2, 15, 15, 0, 0, tzinfo=UTC)
-        ical_event = _create_ical_event(
+        ical_data = _create_ical_feed(
             summary="Test Event",
             start=event_start_utc,
             end=event_end_utc,
         )
-        ical_data = _create_ical_calendar([ical_event])
 
         with patch(
             "custom_components.grocy.calendar.async_get_clientsession"
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = FEBRUARY_START
+            end_date = FEBRUARY_END
 
             await entity._update_events(start_date, end_date)
 
@@ -201,7 +271,7 @@ class TestCalendarEntityTimezoneFixEnabled:
 
         # With fix_timezone=True, the 14:00 UTC should be treated as 14:00 local
         # Not converted (which would make it 15:00 in Europe/Berlin during winter)
-        local_tz = ZoneInfo("Europe/Berlin")
+        local_tz = BERLIN
         expected_start = datetime(2026, 2, 15, 14, 0, 0, tzinfo=local_tz)
         expected_end = datetime(2026, 2, 15, 15, 0, 0, tzinfo=local_tz)
 
@@ -217,7 +287,7 @@ class TestCalendarEntityTimezoneFixEnabled:
     ) -> None:
         """Test that naive datetimes (no timezone) are assumed UTC and converted."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
@@ -226,20 +296,19 @@ class TestCalendarEntityTimezoneFixEnabled:
         # Create event with naive datetime (no timezone info)
         event_start_naive = datetime(2026, 2, 15, 14, 0, 0)
         event_end_naive = datetime(2026, 2, 15, 15, 0, 0)
-        ical_event = _create_ical_event(
+        ical_data = _create_ical_feed(
             summary="Naive Event",
             start=event_start_naive,
             end=event_end_naive,
         )
-        ical_data = _create_ical_calendar([ical_event])
 
         with patch(
             "custom_components.grocy.calendar.async_get_clientsession"
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = FEBRUARY_START
+            end_date = FEBRUARY_END
 
             await entity._update_events(start_date, end_date)
 
@@ -248,7 +317,7 @@ class TestCalendarEntityTimezoneFixEnabled:
 
         # Naive datetime is interpreted as UTC and converted to local
         # 14:00 UTC -> 15:00 Europe/Berlin (winter time, +1 hour)
-        local_tz = ZoneInfo("Europe/Berlin")
+        local_tz = BERLIN
         expected_start = datetime(2026, 2, 15, 15, 0, 0, tzinfo=local_tz)
         expected_end = datetime(2026, 2, 15, 16, 0, 0, tzinfo=local_tz)
 
@@ -289,7 +358,7 @@ class TestCalendarEntityTimezoneFixDisabled:
         This is the correct behavior for Grocy instances that properly send UTC times.
         """
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, config_entry_fix_disabled)
         entity.hass = hass
@@ -298,20 +367,19 @@ class TestCalendarEntityTimezoneFixDisabled:
         # Create event at 14:00 UTC (should be converted to 15:00 Berlin time)
         event_start_utc = datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC)
         event_end_utc = datetime(2026, 2, 15, 15, 0, 0, tzinfo=UTC)
-        ical_event = _create_ical_event(
+        ical_data = _create_ical_feed(
             summary="Test Event",
             start=event_start_utc,
             end=event_end_utc,
         )
-        ical_data = _create_ical_calendar([ical_event])
 
         with patch(
             "custom_components.grocy.calendar.async_get_clientsession"
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = FEBRUARY_START
+            end_date = FEBRUARY_END
 
             await entity._update_events(start_date, end_date)
 
@@ -319,7 +387,7 @@ class TestCalendarEntityTimezoneFixDisabled:
         event = entity._events[0]
 
         # With fix_timezone=False, 14:00 UTC should be converted to 15:00 Berlin
-        local_tz = ZoneInfo("Europe/Berlin")
+        local_tz = BERLIN
         expected_start = datetime(2026, 2, 15, 15, 0, 0, tzinfo=local_tz)
         expected_end = datetime(2026, 2, 15, 16, 0, 0, tzinfo=local_tz)
 
@@ -340,7 +408,7 @@ class TestCalendarEntityAllDayEvents:
     ) -> None:
         """Test that a single-day all-day event is handled correctly."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
@@ -348,27 +416,26 @@ class TestCalendarEntityAllDayEvents:
 
         # Create all-day event for Feb 15, 2026
         # In iCal format, all-day events have DTEND as the day AFTER the event ends
-        ical_event = _create_ical_event(
+        ical_data = _create_ical_feed(
             summary="All Day Event",
             start_date="20260215",
             end_date="20260216",  # Exclusive end date
         )
-        ical_data = _create_ical_calendar([ical_event])
 
         with patch(
             "custom_components.grocy.calendar.async_get_clientsession"
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = FEBRUARY_START
+            end_date = FEBRUARY_END
 
             await entity._update_events(start_date, end_date)
 
         assert len(entity._events) == 1
         event = entity._events[0]
 
-        local_tz = ZoneInfo("Europe/Berlin")
+        local_tz = BERLIN
         # Start should be at beginning of day (00:00:00)
         expected_start = datetime(2026, 2, 15, 0, 0, 0, tzinfo=local_tz)
         # End should be at end of day (23:59:59.999999)
@@ -386,34 +453,33 @@ class TestCalendarEntityAllDayEvents:
     ) -> None:
         """Test that a multi-day all-day event spans correctly."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
         entity._ical_url = "http://test.local/calendar.ics"
 
         # Create all-day event spanning Feb 15-17, 2026
-        ical_event = _create_ical_event(
+        ical_data = _create_ical_feed(
             summary="Multi Day Event",
             start_date="20260215",
             end_date="20260218",  # Exclusive: means event ends on Feb 17
         )
-        ical_data = _create_ical_calendar([ical_event])
 
         with patch(
             "custom_components.grocy.calendar.async_get_clientsession"
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = FEBRUARY_START
+            end_date = FEBRUARY_END
 
             await entity._update_events(start_date, end_date)
 
         assert len(entity._events) == 1
         event = entity._events[0]
 
-        local_tz = ZoneInfo("Europe/Berlin")
+        local_tz = BERLIN
         expected_start = datetime(2026, 2, 15, 0, 0, 0, tzinfo=local_tz)
         # End is one day before exclusive end date, at end of day
         expected_end = datetime(2026, 2, 17, 23, 59, 59, 999999, tzinfo=local_tz)
@@ -430,33 +496,32 @@ class TestCalendarEntityAllDayEvents:
     ) -> None:
         """Test that an all-day event without end date ends at end of start day."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
         entity._ical_url = "http://test.local/calendar.ics"
 
         # Create all-day event with no end date
-        ical_event = _create_ical_event(
+        ical_data = _create_ical_feed(
             summary="All Day No End",
             start_date="20260215",
         )
-        ical_data = _create_ical_calendar([ical_event])
 
         with patch(
             "custom_components.grocy.calendar.async_get_clientsession"
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = FEBRUARY_START
+            end_date = FEBRUARY_END
 
             await entity._update_events(start_date, end_date)
 
         assert len(entity._events) == 1
         event = entity._events[0]
 
-        local_tz = ZoneInfo("Europe/Berlin")
+        local_tz = BERLIN
         expected_start = datetime(2026, 2, 15, 0, 0, 0, tzinfo=local_tz)
         expected_end = datetime(2026, 2, 15, 23, 59, 59, 999999, tzinfo=local_tz)
 
@@ -477,7 +542,7 @@ class TestCalendarEntityEdgeCases:
     ) -> None:
         """Test that a timed event without end time defaults to 1 hour duration."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
@@ -485,19 +550,18 @@ class TestCalendarEntityEdgeCases:
 
         # Create timed event with no end time
         event_start_utc = datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC)
-        ical_event = _create_ical_event(
+        ical_data = _create_ical_feed(
             summary="No End Time",
             start=event_start_utc,
         )
-        ical_data = _create_ical_calendar([ical_event])
 
         with patch(
             "custom_components.grocy.calendar.async_get_clientsession"
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = FEBRUARY_START
+            end_date = FEBRUARY_END
 
             await entity._update_events(start_date, end_date)
 
@@ -506,7 +570,7 @@ class TestCalendarEntityEdgeCases:
 
         # With fix_timezone=True, 14:00 UTC becomes 14:00 local
         # End should be 1 hour after start
-        local_tz = ZoneInfo("Europe/Berlin")
+        local_tz = BERLIN
         expected_start = datetime(2026, 2, 15, 14, 0, 0, tzinfo=local_tz)
         expected_end = datetime(2026, 2, 15, 15, 0, 0, tzinfo=local_tz)
 
@@ -522,7 +586,7 @@ class TestCalendarEntityEdgeCases:
     ) -> None:
         """Test that multiple events are sorted by start time."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
@@ -554,8 +618,8 @@ class TestCalendarEntityEdgeCases:
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = FEBRUARY_START
+            end_date = FEBRUARY_END
 
             await entity._update_events(start_date, end_date)
 
@@ -574,39 +638,120 @@ class TestCalendarEntityEdgeCases:
     ) -> None:
         """Test that the event property returns the next upcoming event."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
         entity._ical_url = "http://test.local/calendar.ics"
 
-        local_tz = ZoneInfo("Europe/Berlin")
+        local_tz = BERLIN
         now = dt_util.now()
 
         # Create events: one past, one current, one future
-        entity._events = [
-            CalendarEvent(
-                summary="Past Event",
-                start=now - timedelta(hours=2),
-                end=now - timedelta(hours=1),
-            ),
-            CalendarEvent(
-                summary="Current Event",
-                start=now - timedelta(minutes=30),
-                end=now + timedelta(minutes=30),
-            ),
-            CalendarEvent(
-                summary="Future Event",
-                start=now + timedelta(hours=1),
-                end=now + timedelta(hours=2),
-            ),
-        ]
+        entity._set_events(
+            [
+                CalendarEvent(
+                    summary="Past Event",
+                    start=now - timedelta(hours=2),
+                    end=now - timedelta(hours=1),
+                ),
+                CalendarEvent(
+                    summary="Current Event",
+                    start=now - timedelta(minutes=30),
+                    end=now + timedelta(minutes=30),
+                ),
+                CalendarEvent(
+                    summary="Future Event",
+                    start=now + timedelta(hours=1),
+                    end=now + timedelta(hours=2),
+                ),
+            ]
+        )
 
         next_event = entity.event
         assert next_event is not None
         # Should return the current event (now is between start and end)
         assert next_event.summary == "Current Event"
 
+    @pytest.mark.asyncio
+    async def test_event_property_returns_long_running_event(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that an ongoing event is found even if later events already ended."""
+        hass.config.time_zone = "Europe/Berlin"
+        dt_util.set_default_time_zone(BERLIN)
+
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+
+        now = dt_util.now()
+        entity._set_events(
+            [
+                CalendarEvent(
+                    summary="Multi Day Event",
+                    start=now - timedelta(days=2),
+                    end=now + timedelta(days=1),
+                ),
+                CalendarEvent(
+                    summary="Past Event",
+                    start=now - timedelta(hours=2),
+                    end=now - timedelta(hours=1),
+                ),
+                CalendarEvent(
+                    summary="Future Event",
+                    start=now + timedelta(hours=1),
+                    end=now + timedelta(hours=2),
+                ),
+            ]
+        )
+
+        next_event = entity.event
+        assert next_event is not None
+        assert next_event.summary == "Multi Day Event"
+
+    @pytest.mark.asyncio
+    async def test_event_property_cache_expires_when_event_ends(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that the cached event is replaced once the current event ends."""
+        hass.config.time_zone = "Europe/Berlin"
+        dt_util.set_default_time_zone(BERLIN)
+
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+
+        now = dt_util.now()
+        entity._set_events(
+            [
+                CalendarEvent(
+                    summary="Current Event",
+                    start=now - timedelta(minutes=30),
+                    end=now + timedelta(minutes=30),
+                ),
+                CalendarEvent(
+                    summary="Future Event",
+                    start=now + timedelta(hours=1),
+                    end=now + timedelta(hours=2),
+                ),
+            ]
+        )
+
+        with patch("custom_components.grocy.calendar.dt_util.now", return_value=now):
+            assert entity.event.summary == "Current Event"
+            assert entity.event.summary == "Current Event"
+
+        with patch(
+            "custom_components.grocy.calendar.dt_util.now",
+            return_value=now + timedelta(minutes=45),
+        ):
+            assert entity.event.summary == "Future Event"
+
     @pytest.mark.asyncio
     async def test_event_property_returns_none_when_no_events(
         self,
@@ -616,7 +761,7 @@ class TestCalendarEntityEdgeCases:
     ) -> None:
         """Test that the event property returns None when there are no events."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
@@ -624,6 +769,83 @@ class TestCalendarEntityEdgeCases:
 
         assert entity.event is None
 
+    @pytest.mark.asyncio
+    async def test_async_get_events_returns_events_in_range(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that cached events are filtered to the requested range."""
+        hass.config.time_zone = "Europe/Berlin"
+        dt_util.set_default_time_zone(BERLIN)
+
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+
+        local_tz = BERLIN
+        entity._set_events(
+            [
+                CalendarEvent(
+                    summary=f"Event {day}",
+                    start=datetime(2026, 2, day, 10, 0, 0, tzinfo=local_tz),
+                    end=datetime(2026, 2, day, 11, 0, 0, tzinfo=local_tz),
+                )
+                for day in (1, 10, 15, 20, 28)
+            ]
+        )
+        entity._events_window = (
+            datetime(2025, 1, 1, tzinfo=local_tz),
+            datetime(2027, 12, 31, tzinfo=local_tz),
+        )
+        entity._ical_hash = b"cached"
+        entity._mark_updated(dt_util.now())
+
+        events = await entity.async_get_events(
+            hass,
+            datetime(2026, 2, 10, 10, 0, 0, tzinfo=local_tz),
+            datetime(2026, 2, 20, 10, 0, 0, tzinfo=local_tz),
+        )
+
+        assert [event.summary for event in events] == [
+            "Event 10",
+            "Event 15",
+            "Event 20",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_get_events_refreshes_after_sync_interval(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that cached events are reused until the sync interval has passed."""
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+        entity._ical_hash = b"cached"
+        entity._events_window = (
+            datetime(2025, 1, 1, tzinfo=UTC),
+            datetime(2027, 12, 31, tzinfo=UTC),
+        )
+        start_date = datetime(2026, 2, 1, tzinfo=UTC)
+        end_date = datetime(2026, 2, 28, tzinfo=UTC)
+
+        with patch.object(
+            entity, "_update_events", new_callable=AsyncMock
+        ) as mock_update:
+            entity._mark_updated(dt_util.now())
+            await entity.async_get_events(hass, start_date, end_date)
+            mock_update.assert_not_called()
+
+            entity._mark_updated(
+                dt_util.now() - timedelta(minutes=entity._sync_interval_minutes)
+            )
+            await entity.async_get_events(hass, start_date, end_date)
+            mock_update.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_http_error_handling(
         self,
@@ -633,7 +855,7 @@ class TestCalendarEntityEdgeCases:
     ) -> None:
         """Test that HTTP errors are handled gracefully."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
@@ -645,14 +867,304 @@ class TestCalendarEntityEdgeCases:
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session("", status=500)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = FEBRUARY_START
+            end_date = FEBRUARY_END
 
             # Should not raise, just return without updating events
             await entity._update_events(start_date, end_date)
 
         assert entity._events == []
 
+    @pytest.mark.asyncio
+    async def test_unchanged_ical_data_skips_parsing(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that an identical iCal payload is not parsed a second time."""
+        hass.config.time_zone = "Europe/Berlin"
+        dt_util.set_default_time_zone(BERLIN)
+
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+
+        ical_data = _create_ical_feed(
+            summary="Cached Event",
+            start=datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC),
+            end=datetime(2026, 2, 15, 15, 0, 0, tzinfo=UTC),
+        )
+
+        start_date = FEBRUARY_START
+        end_date = FEBRUARY_END
+
+        with patch(
+            "custom_components.grocy.calendar.async_get_clientsession"
+        ) as mock_get_session:
+            mock_get_session.return_value = _create_mock_session(ical_data)
+            await entity._update_events(start_date, end_date)
+            cached_events = entity._events
+
+            with patch.object(
+                entity, "_parse_ical_events", wraps=entity._parse_ical_events
+            ) as mock_parse:
+                await entity._update_events(start_date, end_date)
+
+        mock_parse.assert_not_called()
+        assert entity._events is cached_events
+        assert entity._last_update is not None
+
+    @pytest.mark.asyncio
+    async def test_new_etag_for_unchanged_ical_data_is_stored(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that new validators are cached even when the payload is identical."""
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+        entity._store = MagicMock()
+
+        ical_data = _create_ical_feed(
+            summary="Cached Event",
+            start=datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC),
+            end=datetime(2026, 2, 15, 15, 0, 0, tzinfo=UTC),
+        )
+
+        start_date = datetime(2026, 2, 1, tzinfo=UTC)
+        end_date = datetime(2026, 2, 28, tzinfo=UTC)
+
+        for etag in ('"a"', '"b"', '"b"'):
+            entity._session = _create_mock_session(ical_data, headers={"ETag": etag})
+            await entity._update_events(start_date, end_date)
+
+        assert entity._store.async_delay_save.call_count == 2
+        data_func = entity._store.async_delay_save.call_args.args[0]
+        assert data_func()["etag"] == '"b"'
+
+    @pytest.mark.asyncio
+    async def test_events_outside_window_not_cached(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that only events overlapping the requested window are cached."""
+        hass.config.time_zone = "Europe/Berlin"
+        dt_util.set_default_time_zone(BERLIN)
+
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+
+        february_event = _create_ical_event(
+            summary="February Event",
+            start=datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC),
+            end=datetime(2026, 2, 15, 15, 0, 0, tzinfo=UTC),
+            uid="february",
+        )
+        june_event = _create_ical_event(
+            summary="June Event",
+            start=datetime(2026, 6, 15, 14, 0, 0, tzinfo=UTC),
+            end=datetime(2026, 6, 15, 15, 0, 0, tzinfo=UTC),
+            uid="june",
+        )
+        ical_data = _create_ical_calendar([february_event, june_event])
+
+        start_date = FEBRUARY_START
+        end_date = FEBRUARY_END
+
+        with patch(
+            "custom_components.grocy.calendar.async_get_clientsession"
+        ) as mock_get_session:
+            mock_get_session.return_value = _create_mock_session(ical_data)
+            await entity._update_events(start_date, end_date)
+            assert [event.summary for event in entity._events] == ["February Event"]
+
+            # A wider window reuses the already parsed feed
+            wider_end_date = datetime(2026, 6, 30, tzinfo=BERLIN)
+            await entity._update_events(start_date, wider_end_date)
+
+        assert [event.summary for event in entity._events] == [
+            "February Event",
+            "June Event",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cached_events_restored_after_restart(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that parsed events are stored and restored by a new entity."""
+        hass.config.time_zone = "Europe/Berlin"
+        dt_util.set_default_time_zone(BERLIN)
+
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+        entity._store = calendar_store(hass, calendar_config_entry.entry_id)
+
+        event_start = dt_util.now().replace(microsecond=0) + timedelta(days=1)
+        ical_data = _create_ical_feed(
+            summary="Stored Event",
+            start=event_start.astimezone(UTC),
+            end=(event_start + timedelta(hours=1)).astimezone(UTC),
+        )
+
+        with patch(
+            "custom_components.grocy.calendar.async_get_clientsession"
+        ) as mock_get_session:
+            mock_get_session.return_value = _create_mock_session(
+                ical_data, headers={"ETag": '"abc"'}
+            )
+            await entity._update_events(*entity._default_events_window())
+
+        # Pending delayed writes are returned by the store that scheduled them
+        restored = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        restored.hass = hass
+        restored._store = entity._store
+        await restored._async_load_cached_events()
+
+        assert restored._events == entity._events
+        assert restored._ical_hash == entity._ical_hash
+        assert restored._ical_etag == '"abc"'
+        assert restored._last_update is not None
+
+    @pytest.mark.asyncio
+    async def test_not_modified_response_keeps_cached_events(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that the ETag is sent back and a 304 keeps the cached events."""
+        hass.config.time_zone = "Europe/Berlin"
+        dt_util.set_default_time_zone(BERLIN)
+
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+
+        ical_data = _create_ical_feed(
+            summary="Cached Event",
+            start=datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC),
+            end=datetime(2026, 2, 15, 15, 0, 0, tzinfo=UTC),
+        )
+
+        start_date = FEBRUARY_START
+        end_date = FEBRUARY_END
+
+        with patch(
+            "custom_components.grocy.calendar.async_get_clientsession"
+        ) as mock_get_session:
+            mock_get_session.return_value = _create_mock_session(
+                ical_data, headers={"ETag": '"abc"'}
+            )
+            await entity._update_events(start_date, end_date)
+
+            session = _create_mock_session("", status=304)
+            entity._session = session
+            await entity._update_events(start_date, end_date)
+
+        assert session.requests[-1][1]["headers"] == {"If-None-Match": '"abc"'}
+        assert len(entity._events) == 1
+        assert entity._events[0].summary == "Cached Event"
+
+    @pytest.mark.asyncio
+    async def test_parse_failure_does_not_keep_validators(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that a feed which failed to parse is fetched in full again."""
+        hass.config.time_zone = "Europe/Berlin"
+        dt_util.set_default_time_zone(BERLIN)
+
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+
+        ical_data = _create_ical_feed(
+            summary="Cached Event",
+            start=datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC),
+            end=datetime(2026, 2, 15, 15, 0, 0, tzinfo=UTC),
+        )
+
+        entity._session = _create_mock_session(ical_data, headers={"ETag": '"v1"'})
+        with patch(
+            "custom_components.grocy.calendar.read_vevents",
+            side_effect=ValueError("bad payload"),
+        ):
+            await entity._update_events(FEBRUARY_START, FEBRUARY_END)
+
+        assert entity._events == []
+        assert entity._ical_etag is None
+
+        session = _create_mock_session(ical_data, headers={"ETag": '"v1"'})
+        entity._session = session
+        await entity._update_events(FEBRUARY_START, FEBRUARY_END)
+
+        assert session.requests[-1][1]["headers"] == {}
+        assert len(entity._events) == 1
+        assert entity._ical_etag == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sync_skips_state_write(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that a sync which keeps the same events does not write state."""
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+        entity._ical_url_last_checked = dt_util.utcnow()
+        entity.async_write_ha_state = MagicMock()
+
+        with patch.object(entity, "_update_events", new_callable=AsyncMock):
+            await entity._async_update_calendar(dt_util.now())
+            await entity._async_update_calendar(dt_util.now())
+
+            entity.async_write_ha_state.assert_called_once()
+
+            entity._set_events([])
+            await entity._async_update_calendar(dt_util.now())
+
+        assert entity.async_write_ha_state.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_found_marks_ical_url_stale(
+        self,
+        hass,
+        mock_coordinator,
+        calendar_config_entry,
+    ) -> None:
+        """Test that a revoked sharing link is refetched on the next sync."""
+        entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
+        entity.hass = hass
+        entity._ical_url = "http://test.local/calendar.ics"
+        entity._ical_url_last_checked = dt_util.utcnow()
+        assert not entity._ical_url_is_stale()
+
+        with patch(
+            "custom_components.grocy.calendar.async_get_clientsession"
+        ) as mock_get_session:
+            mock_get_session.return_value = _create_mock_session("", status=404)
+
+            start_date = datetime(2026, 2, 1, tzinfo=UTC)
+            end_date = datetime(2026, 2, 28, tzinfo=UTC)
+
+            await entity._update_events(start_date, end_date)
+
+        assert entity._ical_url_is_stale()
+
 
 @pytest.mark.feature("calendar")
 class TestCalendarEntityTimezoneEdgeCases:
@@ -667,7 +1179,7 @@ class TestCalendarEntityTimezoneEdgeCases:
     ) -> None:
         """Test event during daylight saving time transition."""
         hass.config.time_zone = "Europe/Berlin"
-        dt_util.set_default_time_zone(ZoneInfo("Europe/Berlin"))
+        dt_util.set_default_time_zone(BERLIN)
 
         entity = GrocyCalendarEntity(mock_coordinator, calendar_config_entry)
         entity.hass = hass
@@ -677,20 +1189,19 @@ class TestCalendarEntityTimezoneEdgeCases:
         # 14:00 UTC on this day should be treated as 14:00 local with fix enabled
         event_start_utc = datetime(2026, 3, 29, 14, 0, 0, tzinfo=UTC)
         event_end_utc = datetime(2026, 3, 29, 15, 0, 0, tzinfo=UTC)
-        ical_event = _create_ical_event(
+        ical_data = _create_ical_feed(
             summary="DST Event",
             start=event_start_utc,
             end=event_end_utc,
         )
-        ical_data = _create_ical_calendar([ical_event])
 
         with patch(
             "custom_components.grocy.calendar.async_get_clientsession"
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 3, 1, tzinfo=ZoneInfo("Europe/Berlin"))
-            end_date = datetime(2026, 3, 31, tzinfo=ZoneInfo("Europe/Berlin"))
+            start_date = datetime(2026, 3, 1, tzinfo=BERLIN)
+            end_date = datetime(2026, 3, 31, tzinfo=BERLIN)
 
             await entity._update_events(start_date, end_date)
 
@@ -698,7 +1209,7 @@ class TestCalendarEntityTimezoneEdgeCases:
         event = entity._events[0]
 
         # With fix_timezone=True, time should be treated as local
-        local_tz = ZoneInfo("Europe/Berlin")
+        local_tz = BERLIN
         expected_start = datetime(2026, 3, 29, 14, 0, 0, tzinfo=local_tz)
         expected_end = datetime(2026, 3, 29, 15, 0, 0, tzinfo=local_tz)
 
@@ -713,7 +1224,7 @@ class TestCalendarEntityTimezoneEdgeCases:
     ) -> None:
         """Test timezone handling with US/Pacific timezone."""
         hass.config.time_zone = "America/Los_Angeles"
-        dt_util.set_default_time_zone(ZoneInfo("America/Los_Angeles"))
+        dt_util.set_default_time_zone(PACIFIC)
 
         config_entry = MockConfigEntry(
             domain=DOMAIN,
@@ -729,8 +1240,7 @@ class TestCalendarEntityTimezoneEdgeCases:
             entry_id="test-pacific",
         )
 
-        coordinator = MagicMock()
-        coordinator.entities = []
+        coordinator = SimpleNamespace(entities=[])
 
         entity = GrocyCalendarEntity(coordinator, config_entry)
         entity.hass = hass
@@ -738,20 +1248,19 @@ class TestCalendarEntityTimezoneEdgeCases:
 
         event_start_utc = datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC)
         event_end_utc = datetime(2026, 2, 15, 15, 0, 0, tzinfo=UTC)
-        ical_event = _create_ical_event(
+        ical_data = _create_ical_feed(
             summary="Pacific Event",
             start=event_start_utc,
             end=event_end_utc,
         )
-        ical_data = _create_ical_calendar([ical_event])
 
         with patch(
             "custom_components.grocy.calendar.async_get_clientsession"
         ) as mock_get_session:
             mock_get_session.return_value = _create_mock_session(ical_data)
 
-            start_date = datetime(2026, 2, 1, tzinfo=ZoneInfo("America/Los_Angeles"))
-            end_date = datetime(2026, 2, 28, tzinfo=ZoneInfo("America/Los_Angeles"))
+            start_date = datetime(2026, 2, 1, tzinfo=PACIFIC)
+            end_date = datetime(2026, 2, 28, tzinfo=PACIFIC)
 
             await entity._update_events(start_date, end_date)
 
@@ -759,7 +1268,7 @@ class TestCalendarEntityTimezoneEdgeCases:
         event = entity._events[0]
 
         # With fix_timezone=True, 14:00 UTC becomes 14:00 Pacific
-        local_tz = ZoneInfo("America/Los_Angeles")
+        local_tz = PACIFIC
         expected_start = datetime(2026, 2, 15, 14, 0, 0, tzinfo=local_tz)
         expected_end = datetime(2026, 2, 15, 15, 0, 0, tzinfo=local_tz)
 
@@ -791,6 +1300,29 @@ class TestCalendarEntityConfiguration:
         entity = GrocyCalendarEntity(mock_coordinator, config_entry)
         assert entity._fix_timezone is True
 
+    def test_sharing_link_api_url_keeps_path(
+        self,
+        mock_coordinator,
+    ) -> None:
+        """Test that the sharing-link endpoint keeps the Grocy base path."""
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Grocy",
+            data={
+                CONF_URL: "https://example.com/grocy/",
+                CONF_API_KEY: "test-token",
+                CONF_PORT: 443,
+                CONF_VERIFY_SSL: False,
+            },
+            entry_id="test-sharing-link-path",
+        )
+
+        entity = GrocyCalendarEntity(mock_coordinator, config_entry)
+        assert (
+            entity._sharing_link_api_url
+            == "https://example.com:443/grocy/api/calendar/ical/sharing-link"
+        )
+
     def test_fix_timezone_can_be_disabled(
         self,
         mock_coordinator,
@@ -852,3 +1384,25 @@ class TestCalendarEntityConfiguration:
 
         entity = GrocyCalendarEntity(mock_coordinator, config_entry)
         assert entity._sync_interval_minutes == 15
+
+    def test_cached_ical_url_loaded_from_config_entry(
+        self,
+        mock_coordinator,
+    ) -> None:
+        """Test that a persisted sharing link is reused without fetching it."""
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Grocy",
+            data={
+                CONF_URL: "https://demo.grocy.info",
+                CONF_API_KEY: "test-token",
+                CONF_PORT: 9192,
+                CONF_VERIFY_SSL: False,
+                DATA_CALENDAR_ICAL_URL: "http://test.local/calendar.ics",
+            },
+            entry_id="test-cached-url",
+        )
+
+        entity = GrocyCalendarEntity(mock_coordinator, config_entry)
+        assert entity._ical_url == "http://test.local/calendar.ics"
+        assert entity._ical_url_is_stale()
@@ -0,0 +1,46 @@
+"""Feature coverage checker tests.
+
+Features: cross_cutting
+See: docs/FEATURES.md#cross-cutting-tests
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.feature("cross_cutting")
+
+CHECK_COVERAGE_PATH = (
+    Path(__file__).resolve().parent.parent / "docs" / "check_coverage.py"
+)
+
+# docs/ is not a package, so load the script from its path
+_spec = importlib.util.spec_from_file_location("check_coverage", CHECK_COVERAGE_PATH)
+check_coverage = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_coverage)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        b"def test_a(): ...\nasync def test_b(): ...\ndef test_a(): ...\n",
+        b"def helper():\n    def test_inner(): ...\n",
+        b'"""Module.\n\ndef test_doc(): ...\n"""\n\ndef test_real(): ...\n',
+        b"def test_a():\n    '''\ndef test_doc(): ...\n    '''\n",
+        b"x = '''\n\"\"\"\n'''\n\ndef test_after_string(): ...\n",
+        b"class TestGroup:\n    def test_method(self): ...\n\n"
+        b"    def helper(self):\n        def test_nested(): ...\n",
+    ],
+)
+def test_scan_without_markers_matches_ast(source: bytes) -> None:
+    path = Path("tests/test_example.py")
+    expected = check_coverage._scan_ast(source, path)
+
+    functions = check_coverage._scan_test_names(source)
+
+    # The fast path either agrees with the AST or leaves the file to it
+    assert functions is None or list(functions.items()) == list(expected.items())
+    assert check_coverage._scan_source(source, path) == expected
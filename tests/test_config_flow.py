@@ -9,15 +9,22 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import requests
 from homeassistant.config_entries import SOURCE_RECONFIGURE, SOURCE_REAUTH
 from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.grocy.config_flow import GrocyFlowHandler
+from custom_components.grocy.config_flow import GrocyFlowHandler, async_migrate_entry
 from custom_components.grocy.const import (
     CONF_API_KEY,
+    CONF_CALENDAR_FIX_TIMEZONE,
+    CONF_CALENDAR_SYNC_INTERVAL,
     CONF_PORT,
     CONF_URL,
     CONF_VERIFY_SSL,
+    DATA_CALENDAR_ICAL_URL,
+    DEFAULT_CALENDAR_SYNC_INTERVAL,
+    DOMAIN,
 )
 
 pytestmark = pytest.mark.feature("configuration_setup")
@@ -106,6 +113,37 @@ async def test_user_step_handles_timeout_error(hass, config_entry_data) -> None:
     assert result["errors"] == {"base": "timeout"}
 
 
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (requests.exceptions.ConnectionError("Connection refused"), "cannot_connect"),
+        (requests.exceptions.ReadTimeout("Read timed out"), "timeout"),
+        (requests.exceptions.ConnectTimeout("Connect timed out"), "timeout"),
+    ],
+)
+async def test_user_step_handles_requests_errors(
+    hass, config_entry_data, error, expected
+) -> None:
+    """Test network errors raised by requests are not reported as auth errors."""
+    flow = GrocyFlowHandler()
+    flow.hass = hass
+
+    async def immediate_executor(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = AsyncMock(side_effect=immediate_executor)
+
+    with patch("custom_components.grocy.config_flow.Grocy") as mock_grocy:
+        client = MagicMock()
+        client.system.info.side_effect = error
+        mock_grocy.return_value = client
+
+        result = await flow.async_step_user(config_entry_data)
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": expected}
+
+
 async def test_abort_when_configured(hass, mock_config_entry) -> None:
     mock_config_entry.add_to_hass(hass)
 
@@ -163,6 +201,13 @@ async def test_reconfigure_step_shows_form(hass, mock_config_entry) -> None:
 
     assert result["type"] == FlowResultType.FORM
     assert result["step_id"] == "reconfigure"
+    suggested = {
+        key.schema: key.description["suggested_value"]
+        for key in result["data_schema"].schema
+        if key.description
+    }
+    assert suggested[CONF_URL] == mock_config_entry.data[CONF_URL]
+    assert suggested[CONF_API_KEY] == mock_config_entry.data[CONF_API_KEY]
 
 
 async def test_reconfigure_step_updates_entry(hass, mock_config_entry) -> None:
@@ -199,7 +244,7 @@ async def test_reconfigure_step_updates_entry(hass, mock_config_entry) -> None:
     assert result["reason"] == "reconfigure_successful"
     flow.async_update_reload_and_abort.assert_called_once_with(
         mock_config_entry,
-        data_updates=new_data,
+        data_updates={**new_data, DATA_CALENDAR_ICAL_URL: None},
     )
 
 
@@ -305,3 +350,26 @@ async def test_reauth_confirm_handles_error(hass, mock_config_entry) -> None:
 
     assert result["type"] == FlowResultType.FORM
     assert result["errors"] == {"base": "invalid_auth"}
+
+
+async def test_migrate_entry_from_version_1(hass, config_entry_data) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data=config_entry_data, version=1)
+    entry.add_to_hass(hass)
+
+    assert await async_migrate_entry(hass, entry)
+
+    assert entry.version == 2
+    assert entry.data == {
+        **config_entry_data,
+        CONF_CALENDAR_SYNC_INTERVAL: DEFAULT_CALENDAR_SYNC_INTERVAL,
+        CONF_CALENDAR_FIX_TIMEZONE: True,
+    }
+
+
+async def test_migrate_entry_skips_current_version(hass, config_entry_data) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data=config_entry_data, version=2)
+    hass.config_entries.async_update_entry = MagicMock()
+
+    assert await async_migrate_entry(hass, entry)
+
+    hass.config_entries.async_update_entry.assert_not_called()
@@ -6,8 +6,9 @@ See: docs/FEATURES.md#10-configuration-setup
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.helpers.update_coordinator import UpdateFailed
@@ -130,3 +131,105 @@ async def test_async_update_data_partial_failure_keeps_previous_data() -> None:
 
     assert result.stock == ["old_item"]
     assert result.tasks == ["task1"]
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_fetches_keys_concurrently() -> None:
+    """All keys are requested before any of the requests has to finish."""
+    coordinator = GrocyDataUpdateCoordinator.__new__(GrocyDataUpdateCoordinator)
+    coordinator.entities = [
+        DummyEntity("stock", enabled=True),
+        DummyEntity("tasks", enabled=True),
+    ]
+    coordinator.data = None
+    tasks_started = asyncio.Event()
+
+    async def mock_update(key: str):
+        if key == "stock":
+            await asyncio.wait_for(tasks_started.wait(), timeout=1)
+            return ["item"]
+        tasks_started.set()
+        return ["task1"]
+
+    coordinator.grocy_data = SimpleNamespace(
+        async_update_data=AsyncMock(side_effect=mock_update)
+    )
+
+    result = await GrocyDataUpdateCoordinator._async_update_data(coordinator)
+
+    assert result.stock == ["item"]
+    assert result.tasks == ["task1"]
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_fetches_shared_key_once() -> None:
+    """Entities sharing a key only cause one request per refresh."""
+    coordinator = GrocyDataUpdateCoordinator.__new__(GrocyDataUpdateCoordinator)
+    coordinator.entities = [
+        DummyEntity("stock", enabled=True),
+        DummyEntity("stock", enabled=True),
+    ]
+    coordinator.grocy_data = SimpleNamespace(
+        async_update_data=AsyncMock(return_value=["item"])
+    )
+
+    result = await GrocyDataUpdateCoordinator._async_update_data(coordinator)
+
+    coordinator.grocy_data.async_update_data.assert_awaited_once_with("stock")
+    assert result.stock == ["item"]
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_keeps_previous_data_for_skipped_keys() -> None:
+    """Keys without an enabled entity are not fetched and keep their value."""
+    from custom_components.grocy.coordinator import GrocyCoordinatorData
+
+    coordinator = GrocyDataUpdateCoordinator.__new__(GrocyDataUpdateCoordinator)
+    coordinator.entities = [
+        DummyEntity("stock", enabled=True),
+        DummyEntity("tasks", enabled=False),
+    ]
+    previous_data = GrocyCoordinatorData()
+    previous_data["tasks"] = ["old_task"]
+    coordinator.data = previous_data
+    coordinator.grocy_data = SimpleNamespace(
+        async_update_data=AsyncMock(return_value=["item"])
+    )
+
+    result = await GrocyDataUpdateCoordinator._async_update_data(coordinator)
+
+    coordinator.grocy_data.async_update_data.assert_awaited_once_with("stock")
+    assert result is not previous_data
+    assert result.stock == ["item"]
+    assert result.tasks == ["old_task"]
+
+
+@pytest.mark.asyncio
+async def test_async_shutdown_cancels_pending_update() -> None:
+    """Shutting down drops an update that is still waiting on Grocy."""
+    coordinator = GrocyDataUpdateCoordinator.__new__(GrocyDataUpdateCoordinator)
+    coordinator.entities = [DummyEntity("stock", enabled=True)]
+    coordinator.data = None
+    started = asyncio.Event()
+
+    async def mock_update(key: str):
+        started.set()
+        await asyncio.sleep(10)
+
+    coordinator.grocy_data = SimpleNamespace(
+        async_update_data=AsyncMock(side_effect=mock_update)
+    )
+
+    update = asyncio.ensure_future(
+        GrocyDataUpdateCoordinator._async_update_data(coordinator)
+    )
+    await started.wait()
+    with patch(
+        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_shutdown"
+    ) as mock_shutdown:
+        await coordinator.async_shutdown()
+
+    mock_shutdown.assert_awaited_once()
+    with pytest.raises(asyncio.CancelledError):
+        await update
+    assert coordinator._pending_update is None
@@ -52,6 +52,7 @@ def _build_sensor(key: str, data) -> GrocySensorEntity:
     description = next(description for description in SENSORS if description.key == key)
     entity = GrocySensorEntity.__new__(GrocySensorEntity)
     entity.entity_description = description
+    entity._attributes_cache = None
     entity.coordinator = SimpleNamespace(data=GrocyCoordinatorData())
     entity.coordinator.data[key] = data
     return entity
@@ -65,6 +66,7 @@ def _build_binary_sensor(
     )
     entity = GrocyBinarySensorEntity.__new__(GrocyBinarySensorEntity)
     entity.entity_description = description
+    entity._attributes_cache = None
     grocy_data = SimpleNamespace(due_soon_days=due_soon_days)
     entity.coordinator = SimpleNamespace(
         data=GrocyCoordinatorData(), grocy_data=grocy_data
@@ -77,6 +79,7 @@ def _build_todo(key: str, data) -> GrocyTodoListEntity:
     description = next(description for description in TODOS if description.key == key)
     entity = GrocyTodoListEntity.__new__(GrocyTodoListEntity)
     entity.entity_description = description
+    entity._attributes_cache = None
     entity.coordinator = SimpleNamespace(data=GrocyCoordinatorData())
     entity.coordinator.data[key] = data
     entity.hass = SimpleNamespace()
@@ -100,6 +103,17 @@ def test_sensor_extra_state_attributes_are_json_safe() -> None:
     assert attributes["products"][0]["id"] == 99
 
 
+@pytest.mark.feature("stock_management")
+def test_sensor_extra_state_attributes_cached_per_data() -> None:
+    """Verify attributes are only rebuilt when the coordinator data changes."""
+    entity = _build_sensor(ATTR_STOCK, [DummyProduct(id=99)])
+    attributes = entity.extra_state_attributes
+    assert entity.extra_state_attributes is attributes
+
+    entity.coordinator.data[ATTR_STOCK] = [DummyProduct(id=100)]
+    assert entity.extra_state_attributes["products"][0]["id"] == 100
+
+
 @pytest.mark.feature("stock_management")
 def test_sensor_native_value_defaults_to_zero() -> None:
     """Verify stock sensor returns 0 when data is None."""
@@ -322,3 +336,13 @@ def test_coordinator_data_defaults_to_none() -> None:
     assert data.stock is None
     assert data.tasks is None
     assert data.batteries is None
+
+
+@pytest.mark.feature("cross_cutting")
+def test_coordinator_data_rejects_unknown_key() -> None:
+    """Verify CoordinatorData only exposes its data fields by key."""
+    data = GrocyCoordinatorData()
+    with pytest.raises(KeyError):
+        data["unknown"] = ["item"]
+    with pytest.raises(KeyError):
+        data["__setitem__"]
@@ -0,0 +1,158 @@
+"""Tests for the lightweight iCal parser used by the calendar platform.
+
+Features: calendar
+See: docs/FEATURES.md#7-calendar
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import icalendar
+import pytest
+
+from custom_components.grocy.ical_parser import (
+    RawEvent,
+    dump_raw_events,
+    load_raw_events,
+    read_vevents,
+    scan_vevents,
+    walk_vevents,
+)
+
+pytestmark = pytest.mark.feature("calendar")
+
+
+def _build_calendar() -> bytes:
+    """Build a calendar covering the value types Grocy emits."""
+    cal = icalendar.Calendar()
+    cal.add("prodid", "-//Test//Test//EN")
+    cal.add("version", "2.0")
+
+    utc_event = icalendar.Event()
+    utc_event.add("summary", "Chore: Vacuum, living room; kitchen")
+    utc_event.add("uid", "utc-event")
+    utc_event.add("dtstart", datetime(2026, 2, 15, 14, 0, 0, tzinfo=UTC))
+    utc_event.add("dtend", datetime(2026, 2, 15, 15, 0, 0, tzinfo=UTC))
+    utc_event.add("description", "Line one\nLine two " + "x" * 120)
+    alarm = icalendar.Alarm()
+    alarm.add("action", "DISPLAY")
+    alarm.add("description", "Reminder")
+    utc_event.add_component(alarm)
+    cal.add_component(utc_event)
+
+    naive_event = icalendar.Event()
+    naive_event.add("summary", "Naive")
+    naive_event.add("uid", "naive-event")
+    naive_event.add("dtstart", datetime(2026, 2, 16, 8, 30, 0))
+    cal.add_component(naive_event)
+
+    tz_event = icalendar.Event()
+    tz_event.add("summary", "Berlin")
+    tz_event.add("uid", "tz-event")
+    tz_event.add(
+        "dtstart",
+        datetime(2026, 2, 17, 9, 0, 0),
+        parameters={"TZID": "Europe/Berlin"},
+    )
+    tz_event.add("location", "Kitchen")
+    cal.add_component(tz_event)
+
+    all_day_event = icalendar.Event()
+    all_day_event.add("summary", "Meal plan")
+    all_day_event.add("uid", "all-day-event")
+    all_day_event.add("dtstart", date(2026, 2, 18))
+    all_day_event.add("dtend", date(2026, 2, 19))
+    cal.add_component(all_day_event)
+
+    todo = icalendar.Todo()
+    todo.add("summary", "Not an event")
+    cal.add_component(todo)
+
+    return cal.to_ical()
+
+
+def test_scan_vevents_matches_icalendar() -> None:
+    data = _build_calendar()
+
+    scanned = scan_vevents(data)
+
+    assert scanned is not None
+    assert scanned == walk_vevents(icalendar.Calendar.from_ical(data))
+    assert [event.uid for event in scanned] == [
+        "utc-event",
+        "naive-event",
+        "tz-event",
+        "all-day-event",
+    ]
+    assert scanned[0].summary == "Chore: Vacuum, living room; kitchen"
+    assert scanned[0].description.startswith("Line one\nLine two xxx")
+    assert scanned[2].start == datetime(
+        2026, 2, 17, 9, 0, 0, tzinfo=ZoneInfo("Europe/Berlin")
+    )
+    assert scanned[3].start == date(2026, 2, 18)
+
+
+def test_scan_vevents_rejects_unsupported_values() -> None:
+    data = (
+        b"BEGIN:VCALENDAR\r\n"
+        b"BEGIN:VEVENT\r\n"
+        b"UID:period\r\n"
+        b"DTSTART;VALUE=PERIOD:20260215T140000Z/PT1H\r\n"
+        b"END:VEVENT\r\n"
+        b"END:VCALENDAR\r\n"
+    )
+
+    assert scan_vevents(data) is None
+
+
+def test_read_vevents_falls_back_to_icalendar() -> None:
+    data = (
+        b"BEGIN:VCALENDAR\r\n"
+        b"VERSION:2.0\r\n"
+        b"PRODID:-//Test//Test//EN\r\n"
+        b"BEGIN:VEVENT\r\n"
+        b'DTSTART;TZID="Europe/Berlin":20260215T140000\r\n'
+        b"SUMMARY:Quoted parameter\r\n"
+        b"UID:quoted\r\n"
+        b"END:VEVENT\r\n"
+        b"END:VCALENDAR\r\n"
+    )
+
+    assert scan_vevents(data) is None
+    events = read_vevents(data)
+
+    assert len(events) == 1
+    assert isinstance(events[0], RawEvent)
+    assert events[0].summary == "Quoted parameter"
+
+
+def test_raw_events_round_trip_keeps_tzid_zone() -> None:
+    london = ZoneInfo("Europe/London")
+    events = [
+        RawEvent(
+            summary="London",
+            start=datetime(2026, 1, 15, 10, 0, 0, tzinfo=london),
+            end=datetime(2026, 1, 15, 11, 0, 0, tzinfo=UTC),
+            description="",
+            location="",
+            uid="tz-event",
+        ),
+        RawEvent(
+            summary="All day",
+            start=date(2026, 1, 16),
+            end=None,
+            description="",
+            location="",
+            uid="all-day-event",
+        ),
+    ]
+
+    restored = load_raw_events(dump_raw_events(events))
+
+    assert restored == events
+    # In winter London is at +00:00, only the zone key tells it apart from UTC
+    assert restored[0].start.tzinfo == london
+    assert restored[0].end.utcoffset() == timedelta(0)
+    assert type(restored[1].start) is date
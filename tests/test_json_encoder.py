@@ -11,7 +11,7 @@ import json
 
 import pytest
 
-from custom_components.grocy.json_encoder import CustomJSONEncoder
+from custom_components.grocy.json_encoder import CustomJSONEncoder, to_json_native
 
 pytestmark = pytest.mark.feature("cross_cutting")
 
@@ -52,3 +52,16 @@ def test_encodes_time_with_microseconds() -> None:
     result = json.dumps(data, cls=CustomJSONEncoder)
     parsed = json.loads(result)
     assert "10:05:30" in parsed["time"]
+
+
+def test_to_json_native_matches_round_trip() -> None:
+    data = {
+        "date": dt.date(2025, 6, 15),
+        "time": dt.time(14, 30, 0),
+        "dt": dt.datetime(2025, 6, 15, 14, 30, 0),
+        "items": ({"id": 1, "tags": {"a"}}, None, 1.5, True),
+        2: "int key",
+        "delta": dt.timedelta(minutes=5),
+    }
+
+    assert to_json_native(data) == json.loads(json.dumps(data, cls=CustomJSONEncoder))
@@ -343,6 +343,7 @@ def _build_todo(key: str, data) -> GrocyTodoListEntity:
     description = next(d for d in TODOS if d.key == key)
     entity = GrocyTodoListEntity.__new__(GrocyTodoListEntity)
     entity.entity_description = description
+    entity._attributes_cache = None
     entity.coordinator = SimpleNamespace(
         data=GrocyCoordinatorData(),
         async_refresh=AsyncMock(),